@@ -94,6 +94,39 @@ download_bluemap() {
     log_info "BlueMap CLI downloaded to $BLUEMAP_DIR/BlueMap-cli.jar"
 }
 
+create_cds_archive() {
+    local archive="$BLUEMAP_DIR/bluemap.jsa"
+    log_info "Creating BlueMap AppCDS archive at $archive..."
+
+    # The exit code of --help is irrelevant; the archive is dumped on JVM exit
+    java -XX:+UseG1GC -XX:ArchiveClassesAtExit="$archive" \
+        -jar "$BLUEMAP_DIR/BlueMap-cli.jar" --help > /dev/null 2>&1 || true
+
+    if [[ -f "$archive" ]]; then
+        log_info "AppCDS archive created"
+    else
+        log_warning "Could not create AppCDS archive; BlueMap will start without it"
+    fi
+}
+
+generate_default_config() {
+    local config_dir="$BLUEMAP_DIR/default-config"
+    log_info "Generating default BlueMap configuration at $config_dir..."
+
+    # BlueMap writes its default configs on first start and then keeps
+    # running, so stop it once they are on disk
+    rm -rf "$config_dir"
+    timeout 60 java -jar "$BLUEMAP_DIR/BlueMap-cli.jar" -c "$config_dir" \
+        < /dev/null > /dev/null 2>&1 || true
+
+    if [[ -f "$config_dir/core.conf" ]]; then
+        log_info "Default configuration generated"
+    else
+        rm -rf "$config_dir"
+        log_warning "Could not generate default configuration; the mapper will generate it at runtime"
+    fi
+}
+
 create_directories() {
     log_info "Creating necessary directories at $WORK_BASE_DIR..."
     mkdir -p "$WORK_BASE_DIR" "$BLUEMAP_DIR/config"
@@ -220,6 +253,8 @@ setup_venv() {
 
 install_system_deps
 download_bluemap
+create_cds_archive
+generate_default_config
 create_directories
 
 if [[ -n "$VENV_DIR" ]]; then
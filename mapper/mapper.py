@@ -2,18 +2,101 @@
 from __future__ import annotations
 
 import argparse
+import atexit
+import ctypes
+import ctypes.util
+import errno
+import fcntl
+import functools
+import hashlib
+import itertools
+import logging
 import os
+import pickle
+import queue
+import re
+import select
 import shutil
+import stat
 import subprocess
+import sys
 import tempfile
+import threading
 import time
+import traceback
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
-from typing import Sequence
+from typing import Any, Callable, Iterable, NoReturn, Sequence
+
+# Amulet pulls in NumPy and PyMCTranslate's translation tables, so it is
+# only imported by _load_amulet() when a conversion actually starts. This
+# keeps --help and startup validation errors fast.
+amulet: Any = None
+AnvilFormat: Any = None
+ChunkDoesNotExist: Any = None
+ChunkLoadError: Any = None
+LoaderNoneMatched: Any = None
+StatusFormats: Any = None
+
+# Linux FICLONE ioctl request (_IOW(0x94, 9, int)): reflink a whole file.
+_FICLONE = 0x40049409
+_COPY_CHUNK_SIZE = 1 << 30
+_COPY_BUFFER_SIZE = 1 << 20
+_MNT_DETACH = 2
+# Pipelined conversion: chunks per hand-off, batches buffered between the
+# reader and writer, and chunks between Amulet cache flushes.
+_CONVERT_BATCH_SIZE = 64
+_CONVERT_QUEUE_BATCHES = 16
+_CONVERT_FLUSH_INTERVAL = 10000
+# Queued to every writer to make it wait at the flush barrier
+_FLUSH = object()
+# Prefix of directories moved aside for background deletion
+_TRASH_PREFIX = ".trash-"
+# Entries listed when the Bedrock world directory is missing
+_MAX_LISTED_ENTRIES = 50
+
+# G1 tuning for BlueMap's render workload (young-gen heavy, large heaps).
+_JAVA_BASE_FLAGS = [
+    "-XX:+UseG1GC",
+    "-XX:+UnlockExperimentalVMOptions",
+    "-XX:G1NewSizePercent=30",
+    "-XX:G1MaxNewSizePercent=40",
+    "-XX:G1HeapRegionSize=8M",
+    "-XX:+ParallelRefProcEnabled",
+    "-XX:+DisableExplicitGC",
+]
+# AppCDS archive created next to the BlueMap JAR by install-deps.sh
+_BLUEMAP_CDS_ARCHIVE_NAME = "bluemap.jsa"
+# Pristine BlueMap configs generated next to the jar at image build time
+_BLUEMAP_DEFAULT_CONFIG_DIR_NAME = "default-config"
+
+# Both core.conf fields in one alternation; group(lastindex) is the key
+_RE_CORE_FIELDS = re.compile(
+    r'(accept-download):\s*false|(render-thread-count):\s*\d+')
+# Line matchers support quoted or unquoted existing values. Surrounding
+# whitespace is limited to [ \t] so a match never swallows the newline,
+# which keeps repeated edits byte-for-byte stable.
+_RE_WEBROOT = re.compile(r'(?m)^[ \t]*webroot:[ \t]*(?:"[^"]*"|\S+)[ \t]*$')
+_RE_STORAGE_ROOT = re.compile(r'(?m)^[ \t]*root:[ \t]*(?:"[^"]*"|\S+)[ \t]*$')
+# All map template fields in one alternation, so the template is scanned once
+_RE_MAP_FIELDS = re.compile(
+    r'(?m)(id|name|world):\s*"[^"]*"'
+    r'|^[ \t]*(ambient-light):[ \t]*[0-9]*\.?[0-9]+[ \t]*$')
+
+
+def _kernel_supports_overlay() -> bool:
+    """Check /proc/filesystems for overlayfs support."""
+    try:
+        with open("/proc/filesystems", encoding="utf-8") as f:
+            return any(line.split()[-1] == "overlay" for line in f if line.strip())
+    except OSError:
+        return False
+
 
-import amulet
-from amulet.api.errors import LoaderNoneMatched
-from amulet.level.formats.anvil_world import AnvilFormat
+_OVERLAY_SUPPORTED = _kernel_supports_overlay()
 
 
 @dataclass(frozen=True)
@@ -26,6 +109,42 @@ class GlobalConfig:
     render_threads: int
     render_interval: int
     ambient_light: float
+    snapshot_workers: int
+    parallel_convert: bool
+    convert_writers: int
+    incremental_convert: bool
+    all_dimensions: bool
+    converter: str
+    chunker_jar: Path
+    chunker_format: str
+    raw_tool_output: bool
+    trigger_port: int
+
+    @functools.cached_property
+    def bluemap_cli(self) -> tuple[str, ...]:
+        """BlueMap CLI prefix including -c, built once per process."""
+        return (*bluemap_command(self), "-c", str(self.config_dir))
+
+    @functools.cached_property
+    def bluemap_conf_jobs(self) -> tuple[tuple[Path, tuple[ConfigEdit, ...], str], ...]:
+        """(config file, edits, message when changed), built once per process."""
+        core_lines = {
+            "accept-download": "accept-download: true",
+            "render-thread-count": f"render-thread-count: {self.render_threads}",
+        }
+        jobs = [
+            (self.config_dir / "core.conf", (
+                (_RE_CORE_FIELDS,
+                 lambda match: core_lines[match.group(match.lastindex)],
+                 False),
+            ), "core.conf updated"),
+        ]
+        for rel, pattern, key, value_of in _PATH_CONF_TARGETS:
+            value = value_of(self)
+            jobs.append((self.config_dir / rel,
+                         ((pattern, f'{key}: "{value}"', True),),
+                         f"{rel} updated with {key}: {value}"))
+        return tuple(jobs)
 
 
 @dataclass(frozen=True)
@@ -35,18 +154,104 @@ class MapConfig:
     max_y: int
 
 
-def log(message: str) -> None:
-    """Log with timestamp."""
-    timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
-    print(f"[{timestamp}] {message}", flush=True)
+class _LogFormatter(logging.Formatter):
+    """Prefix every line of a record with a timestamp cached per second."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._second = -1
+        self._prefix = ""
+
+    def format(self, record: logging.LogRecord) -> str:
+        second = int(record.created)
+        if second != self._second:
+            timestamp = time.strftime("%Y-%m-%d %H:%M:%S",
+                                      time.localtime(second))
+            self._prefix = f"[{timestamp}] "
+            self._second = second
+        prefix = self._prefix
+        return prefix + record.getMessage().replace("\n", "\n" + prefix)
+
+
+logger = logging.getLogger("mapper")
+_log_handler = logging.StreamHandler(sys.stdout)
+_log_handler.setFormatter(_LogFormatter())
+logger.addHandler(_log_handler)
+logger.setLevel(logging.INFO)
+logger.propagate = False
+
+
+def log(message: str, *args: object, level: int = logging.INFO) -> None:
+    """Log with timestamp; args are %-formatted only if the record is emitted."""
+    logger.log(level, message, *args)
+
+
+def log_many(lines: Iterable[str], level: int = logging.INFO) -> None:
+    """Log several lines under one timestamp with a single write."""
+    lines = list(lines)
+    if lines:
+        logger.log(level, "\n".join(lines))
 
 
 def ensure_directories(glb_cfg: GlobalConfig) -> None:
-    """Create necessary directories."""
+    """Create necessary directories and reap trash left by earlier runs."""
     glb_cfg.output_path.mkdir(parents=True, exist_ok=True)
     glb_cfg.config_dir.mkdir(parents=True, exist_ok=True)
     (glb_cfg.config_dir / "maps").mkdir(parents=True, exist_ok=True)
 
+    # Only names discard_directory() produced for the Java world, so other
+    # .trash-* entries on a shared parent volume are left alone
+    java_world_dir = glb_cfg.java_world_dir
+    trash_name = re.compile(
+        re.escape(_trash_name(java_world_dir, "")) + r"[0-9a-f]{32}")
+    if java_world_dir.parent.is_dir():
+        for trash in java_world_dir.parent.glob(f"{_TRASH_PREFIX}*"):
+            if trash_name.fullmatch(trash.name) and trash.is_dir():
+                log(f"Removing leftover trash directory {trash}")
+                delete_in_background(trash)
+
+
+_background_deletions: list[threading.Thread] = []
+
+
+def delete_in_background(path: Path) -> None:
+    """Delete a directory tree on a daemon thread."""
+    thread = threading.Thread(
+        target=shutil.rmtree,
+        args=(path,),
+        kwargs={"ignore_errors": True},
+        name=f"rmtree-{path.name}",
+        daemon=True,
+    )
+    thread.start()
+    _background_deletions[:] = [
+        t for t in _background_deletions if t.is_alive()] + [thread]
+
+
+def wait_for_background_deletions() -> None:
+    """Block until every background deletion has finished."""
+    for thread in _background_deletions:
+        thread.join()
+    _background_deletions.clear()
+
+
+def _trash_name(path: Path, token: str) -> str:
+    """Return the name a discarded copy of path is renamed to."""
+    return f"{_TRASH_PREFIX}{path.name}-{token}"
+
+
+def discard_directory(path: Path) -> None:
+    """Move a directory aside with an O(1) rename and delete it in the background."""
+    trash = path.with_name(_trash_name(path, uuid.uuid4().hex))
+    try:
+        os.rename(path, trash)
+    except OSError as e:
+        log(f"WARNING: Could not move {path} aside ({e}); deleting in place",
+            level=logging.WARNING)
+        shutil.rmtree(path)
+        return
+    delete_in_background(trash)
+
 
 def normalize_output_path(path: Path) -> Path:
     """Normalize mapper output path and ensure it ends with 'webroot'."""
@@ -65,48 +270,781 @@ def validate_environment(glb_cfg: GlobalConfig) -> None:
             f"BlueMap JAR not found at {glb_cfg.bluemap_jar}"
         )
 
+    if glb_cfg.converter == "chunker" and not glb_cfg.chunker_jar.exists():
+        raise FileNotFoundError(
+            f"Chunker JAR not found at {glb_cfg.chunker_jar}"
+        )
+
     if not glb_cfg.bedrock_world_dir.exists():
         log("ERROR: Bedrock world directory not found"
-            f" at {glb_cfg.bedrock_world_dir}")
+            f" at {glb_cfg.bedrock_world_dir}", level=logging.ERROR)
         log("Available directories in parent:")
         parent = glb_cfg.bedrock_world_dir.parent
-        if parent.exists():
-            for item in parent.iterdir():
-                log(f"  - {item}")
+        lines = []
+        try:
+            with os.scandir(parent) as it:
+                for index, entry in enumerate(it):
+                    if index == _MAX_LISTED_ENTRIES:
+                        lines.append(f"  ... and {1 + sum(1 for _ in it)} more")
+                        break
+                    lines.append(f"  - {entry.path}")
+        except OSError as e:
+            # Missing, unreadable or vanished mid-scan; the listing is only a hint
+            lines.append(f"  (cannot list {parent}: {e.strerror})")
+        log_many(lines)
         raise FileNotFoundError(
             f"Bedrock world not found: {glb_cfg.bedrock_world_dir}")
 
 
-def prepare_bedrock_world_source(bedrock_world_dir: Path) -> tuple[Path, Path | None]:
-    """Return a writable world path for Amulet and optional temp dir for cleanup."""
-    if os.access(bedrock_world_dir, os.W_OK):
+_copy_buffers = threading.local()
+
+
+def _copy_buffer() -> bytearray:
+    """Return this thread's reusable copy buffer."""
+    buffer = getattr(_copy_buffers, "buffer", None)
+    if buffer is None:
+        buffer = _copy_buffers.buffer = bytearray(_COPY_BUFFER_SIZE)
+    return buffer
+
+
+def _copy_file_contents(src_fd: int, dst_fd: int) -> None:
+    """Copy file data, preferring reflinks and in-kernel copies over read/write."""
+    try:
+        fcntl.ioctl(dst_fd, _FICLONE, src_fd)
+        return
+    except OSError:
+        pass
+
+    if hasattr(os, "copy_file_range"):
+        try:
+            while os.copy_file_range(src_fd, dst_fd, _COPY_CHUNK_SIZE):
+                pass
+            return
+        except OSError as e:
+            if e.errno not in (errno.ENOSYS, errno.EXDEV, errno.EINVAL,
+                               errno.EOPNOTSUPP):
+                raise
+
+    # Offsets are shared with the calls above, so every fallback resumes
+    # where the previous one stopped.
+    try:
+        while os.sendfile(dst_fd, src_fd, None, _COPY_CHUNK_SIZE):
+            pass
+        return
+    except OSError as e:
+        if e.errno not in (errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP):
+            raise
+
+    buffer = _copy_buffer()
+    with memoryview(buffer) as view:
+        while True:
+            count = os.readv(src_fd, [buffer])
+            if not count:
+                break
+            written = 0
+            while written < count:
+                written += os.write(dst_fd, view[written:count])
+
+
+def _fast_copy_file(src: str, dst: str) -> None:
+    """Copy a single file's data and mtime; the copy is always owner-writable."""
+    src_fd = os.open(src, os.O_RDONLY)
+    try:
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(src_fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        st = os.fstat(src_fd)
+        dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC,
+                         stat.S_IMODE(st.st_mode) | stat.S_IWUSR)
+        try:
+            if st.st_size:
+                _copy_file_contents(src_fd, dst_fd)
+        finally:
+            os.close(dst_fd)
+    finally:
+        os.close(src_fd)
+    os.utime(dst, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+
+def _copy_one(task: tuple[str, str, int]) -> None:
+    """Copy one (src, dst, size) snapshot task; size -1 marks a hardlink."""
+    src, dst, size = task
+    if size < 0:
+        try:
+            os.link(src, dst)
+            return
+        except OSError:
+            pass
+    _fast_copy_file(src, dst)
+
+
+def _remove_path(path: str) -> None:
+    """Remove a file or a whole directory tree."""
+    if os.path.isdir(path) and not os.path.islink(path):
+        shutil.rmtree(path)
+    else:
+        os.unlink(path)
+
+
+def _collect_copy_tasks(src: str, dst: str,
+                        tasks: list[tuple[str, str, int]],
+                        link_tables: bool) -> None:
+    """Mirror the directory skeleton of src under dst and gather file tasks.
+
+    Files already in dst with the source's size and mtime are kept, stale
+    entries are removed, so an existing copy is refreshed incrementally.
+    """
+    os.makedirs(dst, exist_ok=True)
+    with os.scandir(dst) as it:
+        existing = {entry.name: entry for entry in it}
+    with os.scandir(src) as it:
+        for entry in it:
+            dst_path = os.path.join(dst, entry.name)
+            old = existing.pop(entry.name, None)
+            if entry.is_dir():
+                if old is not None and not old.is_dir(follow_symlinks=False):
+                    os.unlink(old.path)
+                _collect_copy_tasks(entry.path, dst_path, tasks, link_tables)
+                continue
+            st = entry.stat()
+            if old is not None:
+                old_st = old.stat(follow_symlinks=False)
+                if (stat.S_ISREG(old_st.st_mode)
+                        and old_st.st_size == st.st_size
+                        and old_st.st_mtime_ns == st.st_mtime_ns):
+                    continue
+                # Never write through the old name: it may be a hardlink
+                # to a source table
+                _remove_path(old.path)
+            if link_tables and entry.name.endswith(".ldb"):
+                tasks.append((entry.path, dst_path, -1))
+            else:
+                tasks.append((entry.path, dst_path, st.st_size))
+    for stale in existing.values():
+        _remove_path(stale.path)
+
+
+def _fast_copy_tree(src: Path | str, dst: Path | str, workers: int,
+                    link_tables: bool = False) -> None:
+    """Copy a directory tree over dst, copying changed files concurrently largest-first.
+
+    With link_tables, LevelDB table files (*.ldb) are hardlinked instead of
+    copied. LevelDB never modifies a sealed table in place; compaction writes
+    new tables and unlinks old ones, so the source world is never touched.
+    Everything else (CURRENT, MANIFEST-*, *.log, level.dat) is copied.
+    """
+    tasks: list[tuple[str, str, int]] = []
+    _collect_copy_tasks(os.fspath(src), os.fspath(dst), tasks, link_tables)
+    # Longest-processing-time-first keeps big .ldb files from straggling.
+    tasks.sort(key=lambda task: task[2], reverse=True)
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        list(executor.map(_copy_one, tasks))
+
+
+def prewarm_page_cache(directory: Path) -> None:
+    """Ask the kernel to start reading every file in directory into the page cache."""
+    if not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                if not entry.is_file():
+                    continue
+                try:
+                    fd = os.open(entry.path, os.O_RDONLY)
+                except OSError:
+                    continue
+                try:
+                    os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+                except OSError:
+                    pass
+                finally:
+                    os.close(fd)
+    except OSError:
+        pass
+
+
+def _try_overlay_mount(src: Path, mountpoint: Path, upper: Path,
+                       work: Path) -> Callable[[], None] | None:
+    """Mount a writable overlay of src at mountpoint and return its unmount function."""
+    # overlayfs uses ',' and ':' as option separators
+    if any(c in str(p) for p in (src, mountpoint, upper, work) for c in ",:"):
+        return None
+
+    options = f"lowerdir={src},upperdir={upper},workdir={work}"
+
+    if _OVERLAY_SUPPORTED:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6",
+                           use_errno=True)
+        target = os.fsencode(mountpoint)
+        if libc.mount(b"overlay", target, b"overlay", 0,
+                      options.encode()) == 0:
+            return lambda: libc.umount2(target, _MNT_DETACH)
+        log("Kernel overlay mount unavailable: "
+            f"{os.strerror(ctypes.get_errno())}")
+
+    fuse_overlayfs = shutil.which("fuse-overlayfs")
+    fusermount = shutil.which("fusermount3") or shutil.which("fusermount")
+    if fuse_overlayfs and fusermount:
+        result = subprocess.run(
+            [fuse_overlayfs, "-o", options, str(mountpoint)],
+            capture_output=True,
+            text=True,
+        )
+        if result.returncode == 0:
+            return lambda: subprocess.run(
+                [fusermount, "-u", "-z", str(mountpoint)],
+                capture_output=True,
+            )
+        log(f"fuse-overlayfs mount failed: {result.stderr.strip()}")
+
+    return None
+
+
+@functools.lru_cache(maxsize=None)
+def _is_writable(path: str) -> bool:
+    """Return whether path is writable; the mount does not change while we run."""
+    return os.access(path, os.W_OK)
+
+
+# Root of the copied snapshot, kept across cycles and refreshed in place
+_snapshot_root: Path | None = None
+
+
+def discard_snapshot() -> None:
+    """Delete the persistent world snapshot, if one was made."""
+    global _snapshot_root
+    if _snapshot_root is not None:
+        shutil.rmtree(_snapshot_root, ignore_errors=True)
+        _snapshot_root = None
+
+
+def prepare_bedrock_world_source(
+    bedrock_world_dir: Path,
+    snapshot_workers: int,
+) -> tuple[Path, Callable[[], None] | None]:
+    """Return a writable world path for Amulet and optional cleanup function."""
+    global _snapshot_root
+    if _is_writable(str(bedrock_world_dir)):
         return bedrock_world_dir, None
 
-    temp_root = Path(tempfile.mkdtemp(prefix="bedrock-world-snapshot-"))
-    snapshot_dir = temp_root / bedrock_world_dir.name
+    if _snapshot_root is None:
+        temp_root = Path(tempfile.mkdtemp(prefix="bedrock-world-snapshot-"))
+        snapshot_dir = temp_root / bedrock_world_dir.name
+
+        upper = temp_root / "upper"
+        work = temp_root / "work"
+        for directory in (snapshot_dir, upper, work):
+            directory.mkdir()
+
+        unmount = _try_overlay_mount(bedrock_world_dir, snapshot_dir,
+                                     upper, work)
+        if unmount is not None:
+            log(f"Bedrock world is read-only; mounted writable overlay at: {snapshot_dir}")
+
+            def cleanup() -> None:
+                unmount()
+                shutil.rmtree(temp_root)
+
+            return snapshot_dir, cleanup
+
+        upper.rmdir()
+        work.rmdir()
+        _snapshot_root = temp_root
+        atexit.register(discard_snapshot)
+        log("Bedrock world is read-only; creating writable snapshot for conversion...")
+    else:
+        log("Bedrock world is read-only; refreshing writable snapshot...")
+
+    snapshot_dir = _snapshot_root / bedrock_world_dir.name
+    same_device = (os.stat(bedrock_world_dir).st_dev
+                   == os.stat(_snapshot_root).st_dev)
+    _fast_copy_tree(bedrock_world_dir, snapshot_dir, snapshot_workers,
+                    link_tables=same_device)
+    log(f"Snapshot ready at: {snapshot_dir}")
+
+    return snapshot_dir, None
+
+
+def _load_amulet() -> None:
+    """Import Amulet and bind it to the module globals."""
+    global amulet, AnvilFormat, ChunkDoesNotExist, ChunkLoadError
+    global LoaderNoneMatched, StatusFormats
+    import amulet
+    from amulet.api.chunk.status import StatusFormats
+    from amulet.api.errors import (ChunkDoesNotExist, ChunkLoadError,
+                                   LoaderNoneMatched)
+    from amulet.level.formats.anvil_world import AnvilFormat
+
+
+class _Progress:
+    """Amulet progress callback that logs at most once per interval.
+
+    Amulet invokes the callback once per chunk, so most calls return after a
+    single modulo check and the clock is only read every ~0.5% of progress.
+    """
+
+    __slots__ = ("label", "interval", "step", "next_report", "monotonic")
+
+    def __init__(self, label: str, interval: float = 5.0) -> None:
+        self.label = label
+        self.interval = interval
+        self.step = 0
+        self.next_report = 0.0
+        self.monotonic = time.monotonic
+
+    def __call__(self, index: int, count: int) -> None:
+        step = self.step
+        if not step:
+            if not count:
+                return
+            step = self.step = max(1, count // 200)
+        if index % step:
+            return
+        now = self.monotonic()
+        if now < self.next_report:
+            return
+        self.next_report = now + self.interval
+        log(f"{self.label}: {index * 100 // count}% ({index}/{count} chunks)")
+
+
+def _chunk_jobs(
+    bedrock_world: Any,
+    java_wrapper: Any,
+    dimensions: Sequence[str],
+) -> list[tuple[str, list[tuple[int, int]]]]:
+    """Return (dimension, chunk coords in region order) for each dimension to copy."""
+    jobs = []
+    for dimension in dimensions:
+        if dimension not in java_wrapper.dimensions:
+            continue
+        coords = sorted(
+            bedrock_world.all_chunk_coords(dimension),
+            key=lambda c: (c[0] >> 5, c[1] >> 5, c[0], c[1]),
+        )
+        jobs.append((dimension, coords))
+    return jobs
 
-    log("Bedrock world is read-only; creating writable snapshot for conversion...")
-    shutil.copytree(bedrock_world_dir, snapshot_dir)
-    log(f"Snapshot created at: {snapshot_dir}")
 
-    return snapshot_dir, temp_root
+# Per-chunk digests of the Bedrock data behind the Java world, stored in it
+_CHUNK_HASHES_NAME = ".chunk_hashes.pkl"
 
+ChunkKey = tuple[str, int, int]
 
-def convert_bedrock_map_to_java_map(glb_cfg: GlobalConfig) -> MapConfig:
-    """Convert Bedrock world to Java Edition format using Amulet."""
 
-    log("=" * 60)
-    log("Converting Bedrock world to Java Edition format...")
-    log(f"Source (Bedrock): {glb_cfg.bedrock_world_dir}")
-    log(f"Target (Java): {glb_cfg.java_world_dir}")
-    log("=" * 60)
+def _load_chunk_hashes(path: Path, world_key: tuple) -> dict[ChunkKey, bytes] | None:
+    """Return the digests saved for world_key, or None if missing or stale."""
+    try:
+        with open(path, "rb") as f:
+            saved_key, hashes = pickle.load(f)
+    except (OSError, EOFError, ValueError, TypeError, pickle.UnpicklingError):
+        return None
+    return hashes if saved_key == world_key else None
+
+
+def _save_chunk_hashes(path: Path, world_key: tuple,
+                       hashes: dict[ChunkKey, bytes]) -> None:
+    """Persist the digests describing a completed conversion."""
+    _atomic_write(path, pickle.dumps((world_key, hashes),
+                                     protocol=pickle.HIGHEST_PROTOCOL))
+
+
+def _chunk_digest(bedrock_world: Any, cx: int, cz: int,
+                  dimension: str) -> bytes | None:
+    """Hash the raw LevelDB records of a chunk, or None if it cannot be read.
+
+    Actors stored outside the chunk's own keys are not included, so chunks
+    are only re-converted when their blocks or block entities change.
+    """
+    try:
+        data = bedrock_world.level_wrapper.get_raw_chunk_data(cx, cz, dimension)
+    except (ChunkDoesNotExist, ChunkLoadError):
+        return None
+    digest = hashlib.blake2b(digest_size=16)
+    for key in sorted(data):
+        value = data[key] or b""
+        digest.update(b"%d:%d:" % (len(key), len(value)))
+        digest.update(key)
+        digest.update(value)
+    return digest.digest()
+
+
+def _changed_chunk_jobs(
+    bedrock_world: Any,
+    java_wrapper: Any,
+    jobs: list[tuple[str, list[tuple[int, int]]]],
+    previous: dict[ChunkKey, bytes],
+) -> tuple[list[tuple[str, list[tuple[int, int]]]], dict[ChunkKey, bytes]]:
+    """Drop chunks whose digest matches previous and delete vanished ones.
+
+    Returns the remaining jobs and the digests of every chunk now present.
+    """
+    hashes: dict[ChunkKey, bytes] = {}
+    changed_jobs = []
+    total = 0
+    changed = 0
+    for dimension, coords in jobs:
+        changed_coords = []
+        for cx, cz in coords:
+            key = (dimension, cx, cz)
+            digest = _chunk_digest(bedrock_world, cx, cz, dimension)
+            if digest is None:
+                # Unreadable this cycle; keep whatever was converted before
+                if key in previous:
+                    hashes[key] = previous[key]
+                continue
+            total += 1
+            hashes[key] = digest
+            if previous.get(key) != digest:
+                changed_coords.append((cx, cz))
+        changed += len(changed_coords)
+        changed_jobs.append((dimension, changed_coords))
+
+    removed = 0
+    for dimension, cx, cz in previous.keys() - hashes.keys():
+        java_wrapper.delete_chunk(cx, cz, dimension)
+        removed += 1
+    log(f"Incremental conversion: {changed} of {total} chunks changed, "
+        f"{removed} removed")
+    return changed_jobs, hashes
+
+
+def _load_full_chunk(level_wrapper: Any, cx: int, cz: int,
+                     dimension: str) -> Any | None:
+    """Load a fully generated chunk straight from the Bedrock wrapper, or None.
+
+    Like BaseLevel.save_iter, this bypasses the level's chunk cache and
+    undo history, which would otherwise keep every converted chunk.
+    """
+    try:
+        chunk = level_wrapper.load_chunk(cx, cz, dimension)
+    except (ChunkDoesNotExist, ChunkLoadError):
+        return None
+    if chunk.status.as_type(StatusFormats.Java_14) != "full":
+        return None
+    return chunk
+
+
+def _flush_conversion(bedrock_world: Any, java_wrapper: Any) -> None:
+    """Write committed Java chunks and drop both wrappers' caches."""
+    java_wrapper.save()
+    bedrock_world.level_wrapper.unload()
+    java_wrapper.unload()
+
+
+def _missing_chunks(java_wrapper: Any,
+                    committed: Sequence[ChunkKey]) -> list[ChunkKey]:
+    """Return the committed chunks that are not in the saved Java world.
+
+    Amulet's commit_chunk logs and swallows its own failures, so checking
+    the result is the only way a dropped chunk shows up.
+    """
+    missing = [key for key in committed
+               if not java_wrapper.has_chunk(key[1], key[2], key[0])]
+    if missing:
+        log(f"WARNING: {len(missing)} of {len(committed)} converted chunks "
+            f"were not written to the Java world (first: {missing[0]})",
+            level=logging.WARNING)
+    return missing
+
+
+def convert_chunks(
+    bedrock_world: Any,
+    java_wrapper: Any,
+    jobs: list[tuple[str, list[tuple[int, int]]]],
+    progress_callback: Callable[[int, int], None],
+) -> list[ChunkKey]:
+    """Copy the chunks listed in jobs into java_wrapper on one thread.
+
+    Returns the chunks that were committed but did not reach the Java world.
+    """
+    level_wrapper = bedrock_world.level_wrapper
+    # Share the loaded translation tables instead of loading a second copy
+    java_wrapper.translation_manager = level_wrapper.translation_manager
+    chunk_count = sum(len(coords) for _, coords in jobs)
+    index = 0
+    committed: list[ChunkKey] = []
+    for dimension, coords in jobs:
+        for cx, cz in coords:
+            index += 1
+            chunk = _load_full_chunk(level_wrapper, cx, cz, dimension)
+            if chunk is None:
+                continue
+            java_wrapper.commit_chunk(chunk, dimension)
+            committed.append((dimension, cx, cz))
+            progress_callback(index, chunk_count)
+            if not len(committed) % _CONVERT_FLUSH_INTERVAL:
+                _flush_conversion(bedrock_world, java_wrapper)
+    java_wrapper.save()
+    return _missing_chunks(java_wrapper, committed)
+
+
+def convert_chunks_pipelined(
+    bedrock_world: Any,
+    java_wrapper: Any,
+    jobs: list[tuple[str, list[tuple[int, int]]]],
+    progress_callback: Callable[[int, int], None],
+    writers: int = 1,
+) -> list[ChunkKey]:
+    """Copy chunks into java_wrapper, overlapping Bedrock reads with Java writes.
+
+    The calling thread loads Bedrock chunks in batches and hands them to
+    writer threads, which commit them to the Anvil wrapper. The wrapper is
+    not thread-safe (its session lock check seeks a shared file handle, and
+    commit_chunk only logs the resulting error and drops the chunk), so
+    commits are serialized and only the Bedrock reads run alongside them.
+    Periodic flushes pause every writer at a barrier while the reader saves
+    and unloads. Returns the chunks that did not reach the Java world.
+    """
+    level_wrapper = bedrock_world.level_wrapper
+    # Assigned before the writers start so none of them loads its own copy
+    java_wrapper.translation_manager = level_wrapper.translation_manager
+    chunk_count = sum(len(coords) for _, coords in jobs)
+    writers = max(1, writers)
+
+    queues: list[queue.Queue] = [
+        queue.Queue(maxsize=_CONVERT_QUEUE_BATCHES) for _ in range(writers)]
+    flush_barrier = threading.Barrier(writers + 1)
+    commit_lock = threading.Lock()
+    committed = itertools.count(1)
+    errors: list[BaseException] = []
+
+    def write_batches(batches: queue.Queue) -> None:
+        while True:
+            batch = batches.get()
+            if batch is None:
+                return
+            if batch is _FLUSH:
+                flush_barrier.wait()  # idle while the reader saves
+                flush_barrier.wait()
+                continue
+            if errors:
+                continue  # keep draining so the reader never blocks
+            dimension, chunks = batch
+            try:
+                for chunk in chunks:
+                    with commit_lock:
+                        java_wrapper.commit_chunk(chunk, dimension)
+                    progress_callback(next(committed), chunk_count)
+            except BaseException as e:
+                errors.append(e)
+
+    threads = [
+        threading.Thread(target=write_batches, args=(batches,),
+                         name=f"chunk-writer-{index}")
+        for index, batches in enumerate(queues)
+    ]
+    for thread in threads:
+        thread.start()
+    queued: list[ChunkKey] = []
+    try:
+        loaded = 0
+        for dimension, coords in jobs:
+            pending: list[list[Any]] = [[] for _ in range(writers)]
+            for cx, cz in coords:
+                if errors:
+                    break
+                chunk = _load_full_chunk(level_wrapper, cx, cz, dimension)
+                if chunk is None:
+                    continue
+                owner = hash((cx >> 5, cz >> 5)) % writers
+                pending[owner].append(chunk)
+                queued.append((dimension, cx, cz))
+                if len(pending[owner]) == _CONVERT_BATCH_SIZE:
+                    queues[owner].put((dimension, pending[owner]))
+                    pending[owner] = []
+                loaded += 1
+                if loaded >= _CONVERT_FLUSH_INTERVAL:
+                    for batches, shard in zip(queues, pending):
+                        if shard:
+                            batches.put((dimension, shard))
+                        batches.put(_FLUSH)
+                    pending = [[] for _ in range(writers)]
+                    flush_barrier.wait()
+                    try:
+                        _flush_conversion(bedrock_world, java_wrapper)
+                    finally:
+                        flush_barrier.wait()
+                    loaded = 0
+            for batches, shard in zip(queues, pending):
+                if shard:
+                    batches.put((dimension, shard))
+    finally:
+        for batches in queues:
+            batches.put(None)
+        for thread in threads:
+            thread.join()
+
+    if errors:
+        raise errors[0]
+    java_wrapper.save()
+    return _missing_chunks(java_wrapper, queued)
+
+
+# (world signature, map config) of the last successful conversion
+_last_conversion: tuple[tuple, MapConfig] | None = None
+
+
+def bedrock_world_signature(bedrock_world_dir: Path) -> tuple:
+    """Return (name, size, mtime_ns) of the world's top-level and db files."""
+    entries = []
+    for directory in (bedrock_world_dir, bedrock_world_dir / "db"):
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    if entry.is_file(follow_symlinks=False):
+                        st = entry.stat(follow_symlinks=False)
+                        entries.append(
+                            (entry.path, st.st_size, st.st_mtime_ns))
+        except FileNotFoundError:
+            pass
+    return tuple(sorted(entries))
+
+
+def _reusable_conversion(glb_cfg: GlobalConfig,
+                         signature: tuple) -> MapConfig | None:
+    """Return the last MapConfig if the world is unchanged since its conversion."""
+    if (_last_conversion is not None
+            and _last_conversion[0] == signature
+            and glb_cfg.java_world_dir.exists()):
+        return _last_conversion[1]
+    return None
+
+
+def run_tool(cmd: Sequence[str], raw_output: bool = False) -> int:
+    """Run an external tool to completion and return its exit code.
+
+    Its merged stdout/stderr is re-logged line by line as it is produced.
+    With raw_output the tool writes straight to our stdout instead, which
+    costs the interpreter nothing but leaves those lines without timestamps.
+    """
+    if raw_output:
+        sys.stdout.flush()
+        return subprocess.run(cmd).returncode
+
+    with subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        bufsize=1,
+    ) as process:
+        for line in process.stdout:
+            log("  %s", line.rstrip())
+    return process.returncode
+
+
+def _read_level_name(world_dir: Path) -> str:
+    """Return a Bedrock world's name without loading the world in Amulet."""
+    try:
+        import amulet_nbt
+
+        # Bedrock level.dat: 8-byte header (version, length), then
+        # little-endian uncompressed NBT
+        data = (world_dir / "level.dat").read_bytes()[8:]
+        named_tag = amulet_nbt.load(data, compressed=False, little_endian=True)
+        name = named_tag.compound["LevelName"].py_str.strip()
+        if name:
+            return name
+    except Exception:
+        pass
+    try:
+        name = (world_dir / "levelname.txt").read_text(encoding="utf-8").strip()
+        if name:
+            return name
+    except OSError:
+        pass
+    return world_dir.name
+
+
+def convert_with_chunker(glb_cfg: GlobalConfig) -> MapConfig:
+    """Convert Bedrock world to Java Edition format using the Chunker CLI."""
+    log_many([
+        "=" * 60,
+        "Converting Bedrock world to Java Edition format with Chunker...",
+        f"Source (Bedrock): {glb_cfg.bedrock_world_dir}",
+        f"Target (Java): {glb_cfg.java_world_dir}",
+        "=" * 60,
+    ])
+
+    load_world_path, cleanup_snapshot = prepare_bedrock_world_source(
+        glb_cfg.bedrock_world_dir,
+        glb_cfg.snapshot_workers,
+    )
+    try:
+        if glb_cfg.java_world_dir.exists():
+            log(f"Removing existing Java world at {glb_cfg.java_world_dir}")
+            discard_directory(glb_cfg.java_world_dir)
+
+        cmd = [
+            "java", *_JAVA_BASE_FLAGS,
+            "-jar", str(glb_cfg.chunker_jar),
+            "-i", str(load_world_path),
+            "-f", glb_cfg.chunker_format,
+            "-o", str(glb_cfg.java_world_dir),
+        ]
+        returncode = run_tool(cmd, glb_cfg.raw_tool_output)
+        if returncode:
+            log(f"ERROR: Chunker failed with exit code {returncode}",
+                level=logging.ERROR)
+            raise subprocess.CalledProcessError(returncode, cmd)
+    finally:
+        if cleanup_snapshot is not None:
+            try:
+                cleanup_snapshot()
+            except Exception:
+                pass
+
+    name = _read_level_name(glb_cfg.bedrock_world_dir)
+    log(f"Level name: {name}")
+    log("Conversion complete!")
+    log(f"Java world created at: {glb_cfg.java_world_dir}")
+
+    # Chunker does not report bounds; use the Overworld's since 1.18
+    return MapConfig(name=name, min_y=-64, max_y=320)
+
+
+def convert_bedrock_map_to_java_map(glb_cfg: GlobalConfig) -> MapConfig:
+    """Convert Bedrock world to Java Edition format with the configured converter."""
+    global _last_conversion
+    # Taken before the snapshot, so writes made during a conversion are
+    # picked up by the next cycle
+    signature = bedrock_world_signature(glb_cfg.bedrock_world_dir)
+    map_cfg = _reusable_conversion(glb_cfg, signature)
+    if map_cfg is not None:
+        log("Bedrock world unchanged since last conversion, reusing Java world")
+        return map_cfg
+
+    if glb_cfg.converter == "chunker":
+        map_cfg = convert_with_chunker(glb_cfg)
+        _last_conversion = (signature, map_cfg)
+        return map_cfg
+
+    # Warm the LevelDB files while Amulet is imported and the snapshot is
+    # prepared; overlay mounts and snapshot copies read the same pages.
+    threading.Thread(
+        target=prewarm_page_cache,
+        args=(glb_cfg.bedrock_world_dir / "db",),
+        name="prewarm",
+        daemon=True,
+    ).start()
+    _load_amulet()
+
+    log_many([
+        "=" * 60,
+        "Converting Bedrock world to Java Edition format...",
+        f"Source (Bedrock): {glb_cfg.bedrock_world_dir}",
+        f"Target (Java): {glb_cfg.java_world_dir}",
+        "=" * 60,
+    ])
 
     bedrock_world = None
     java_wrapper = None
-    snapshot_root = None
+    cleanup_snapshot = None
     try:
-        load_world_path, snapshot_root = prepare_bedrock_world_source(
-            glb_cfg.bedrock_world_dir
+        load_world_path, cleanup_snapshot = prepare_bedrock_world_source(
+            glb_cfg.bedrock_world_dir,
+            glb_cfg.snapshot_workers,
         )
 
         # Load Bedrock world
@@ -122,47 +1060,88 @@ def convert_bedrock_map_to_java_map(glb_cfg: GlobalConfig) -> MapConfig:
         log(f"World bounds: {bounds}")
         log(f"Game version: {bedrock_world.level_wrapper.game_version_string}")
 
-        # Create output directory
-        if glb_cfg.java_world_dir.exists():
-            log(f"Removing existing Java world at {glb_cfg.java_world_dir}")
-            shutil.rmtree(glb_cfg.java_world_dir)
+        # The map config only renders the Overworld, so Nether/End chunks
+        # are skipped unless explicitly requested
+        dimensions = (bedrock_world.dimensions if glb_cfg.all_dimensions
+                      else [dimension])
+
+        hashes_path = glb_cfg.java_world_dir / _CHUNK_HASHES_NAME
+        world_key = (tuple(bedrock_world.level_wrapper.version),
+                     tuple(dimensions))
+        previous_hashes = (_load_chunk_hashes(hashes_path, world_key)
+                           if glb_cfg.incremental_convert else None)
+
+        java_wrapper = AnvilFormat(str(glb_cfg.java_world_dir))
+        if previous_hashes is not None:
+            log(f"Updating existing Java world at {glb_cfg.java_world_dir}")
+            # Dropped until this run completes, so an interrupted update
+            # is rebuilt from scratch next time
+            hashes_path.unlink()
+            java_wrapper.open()
+        else:
+            if glb_cfg.java_world_dir.exists():
+                log(f"Removing existing Java world at {glb_cfg.java_world_dir}")
+                discard_directory(glb_cfg.java_world_dir)
+            java_wrapper.create_and_open(
+                platform="java",
+                version=bedrock_world.level_wrapper.version,
+                overwrite=True,
+            )
 
         # Save as Java Edition
         log("Converting and saving as Java Edition format...")
         log("This may take a while depending on world size...")
 
-        # Create Java output wrapper, then save Bedrock world into it.
-        java_wrapper = AnvilFormat(str(glb_cfg.java_world_dir))
-        java_wrapper.create_and_open(
-            platform="java",
-            version=bedrock_world.level_wrapper.version,
-            overwrite=True,
-        )
-
-        bedrock_world.save(wrapper=java_wrapper)
+        progress_callback = _Progress("Conversion progress")
+        chunk_hashes = None
+        if (glb_cfg.all_dimensions and not glb_cfg.parallel_convert
+                and not glb_cfg.incremental_convert):
+            bedrock_world.save(
+                wrapper=java_wrapper,
+                progress_callback=progress_callback,
+            )
+        else:
+            jobs = _chunk_jobs(bedrock_world, java_wrapper, dimensions)
+            if glb_cfg.incremental_convert:
+                jobs, chunk_hashes = _changed_chunk_jobs(
+                    bedrock_world, java_wrapper, jobs, previous_hashes or {})
+            if glb_cfg.parallel_convert:
+                missing = convert_chunks_pipelined(
+                    bedrock_world, java_wrapper, jobs, progress_callback,
+                    writers=glb_cfg.convert_writers)
+            else:
+                missing = convert_chunks(bedrock_world, java_wrapper,
+                                         jobs, progress_callback)
+            if chunk_hashes is not None:
+                # Forget their digests so the next cycle converts them again
+                for key in missing:
+                    chunk_hashes.pop(key, None)
 
         log("Closing worlds...")
         java_wrapper.close()
         java_wrapper = None
         bedrock_world.close()
         bedrock_world = None
+        if chunk_hashes is not None:
+            _save_chunk_hashes(hashes_path, world_key, chunk_hashes)
 
         log("Conversion complete!")
         log(f"Java world created at: {glb_cfg.java_world_dir}")
 
-        return MapConfig(
+        map_cfg = MapConfig(
             name=name,
             min_y=bounds.min_y,
             max_y=bounds.max_y
         )
+        _last_conversion = (signature, map_cfg)
+        return map_cfg
 
     except LoaderNoneMatched as e:
-        log(f"ERROR: Could not load Bedrock world: {e}")
+        log(f"ERROR: Could not load Bedrock world: {e}", level=logging.ERROR)
         log("Make sure the world path points to a valid Bedrock world directory")
         raise
     except Exception as e:
-        log(f"ERROR during conversion: {e}")
-        import traceback
+        log(f"ERROR during conversion: {e}", level=logging.ERROR)
         traceback.print_exc()
         raise
     finally:
@@ -176,179 +1155,230 @@ def convert_bedrock_map_to_java_map(glb_cfg: GlobalConfig) -> MapConfig:
                 bedrock_world.close()
             except Exception:
                 pass
-        if snapshot_root is not None:
+        if cleanup_snapshot is not None:
             try:
-                shutil.rmtree(snapshot_root)
+                cleanup_snapshot()
             except Exception:
                 pass
 
 
-def generate_bluemap_config(glb_cfg: GlobalConfig) -> None:
-    """Generate BlueMap configuration files if they don't exist."""
-    core_conf = glb_cfg.config_dir / "core.conf"
-    webserver_conf = glb_cfg.config_dir / "webserver.conf"
-    webapp_conf = glb_cfg.config_dir / "webapp.conf"
-    file_storage_conf = glb_cfg.config_dir / "storages" / "file.conf"
+def bluemap_command(glb_cfg: GlobalConfig) -> list[str]:
+    """Return the java command prefix used to launch the BlueMap CLI."""
+    cmd = ["java", *_JAVA_BASE_FLAGS]
+    cds_archive = glb_cfg.bluemap_jar.with_name(_BLUEMAP_CDS_ARCHIVE_NAME)
+    if cds_archive.exists():
+        cmd.append(f"-XX:SharedArchiveFile={cds_archive}")
+    return cmd + ["-jar", str(glb_cfg.bluemap_jar)]
 
-    # First time setup - let BlueMap generate default configs
-    if not core_conf.exists():
-        log("Generating default BlueMap configuration...")
+
+# Stat signatures of config files as last written, keyed on the inputs
+# that produced them, so unchanged files are not re-read every cycle
+_config_cache: dict[tuple, tuple] = {}
+
+
+def _stat_signature(paths: Sequence[Path]) -> tuple | None:
+    """Return (mtime_ns, size) for each path, or None if any is missing."""
+    signature = []
+    for path in paths:
         try:
-            subprocess.run(
-                [
-                    "java", "-jar", str(glb_cfg.bluemap_jar),
-                    "-c", str(glb_cfg.config_dir)
-                ],
-                check=True,
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            log("Default configuration generated")
-        except subprocess.TimeoutExpired:
-            log("Config generation timed out (this is expected if webserver started)")
-        except subprocess.CalledProcessError as e:
-            log(
-                f"Config generation returned exit code {e.returncode} (may be OK)")
-
-    # Update core.conf settings
-    if core_conf.exists():
-        log("Updating core.conf settings...")
-        content = core_conf.read_text(encoding="utf-8")
-
-        # Update accept-download to true
-        content = content.replace(
-            "accept-download: false",
-            "accept-download: true"
-        )
+            st = path.stat()
+        except FileNotFoundError:
+            return None
+        signature.append((st.st_mtime_ns, st.st_size))
+    return tuple(signature)
 
-        # Update render thread count if specified
-        import re
-        content = re.sub(
-            r'render-thread-count:\s*\d+',
-            f'render-thread-count: {glb_cfg.render_threads}',
-            content
-        )
 
-        core_conf.write_text(content, encoding="utf-8")
-        log("core.conf updated")
+ConfigEdit = tuple[re.Pattern[str], str | Callable[[re.Match[str]], str], bool]
 
-    # Update webserver.conf
-    if webserver_conf.exists():
-        log("Updating webserver.conf...")
-        content = webserver_conf.read_text(encoding="utf-8")
 
-        # Update webroot path (supports quoted or unquoted existing values)
-        webroot_line = f'webroot: "{glb_cfg.output_path}"'
-        updated, count = re.subn(
-            r'(?m)^\s*webroot:\s*(?:"[^"]*"|\S+)\s*$',
-            webroot_line,
-            content,
-        )
-        if count == 0:
-            if not updated.endswith("\n"):
-                updated += "\n"
-            updated += webroot_line + "\n"
-        content = updated
-
-        webserver_conf.write_text(content, encoding="utf-8")
-        log(f"webserver.conf updated with webroot: {glb_cfg.output_path}")
-
-    # Update webapp.conf
-    if webapp_conf.exists():
-        log("Updating webapp.conf...")
-        content = webapp_conf.read_text(encoding="utf-8")
-
-        webroot_line = f'webroot: "{glb_cfg.output_path}"'
-        updated, count = re.subn(
-            r'(?m)^\s*webroot:\s*(?:"[^"]*"|\S+)\s*$',
-            webroot_line,
-            content,
-        )
-        if count == 0:
-            if not updated.endswith("\n"):
-                updated += "\n"
-            updated += webroot_line + "\n"
-        content = updated
-
-        webapp_conf.write_text(content, encoding="utf-8")
-        log(f"webapp.conf updated with webroot: {glb_cfg.output_path}")
-
-    # Update storages/file.conf
-    if file_storage_conf.exists():
-        log("Updating storages/file.conf...")
-        content = file_storage_conf.read_text(encoding="utf-8")
-
-        storage_root = glb_cfg.output_path / "maps"
-        root_line = f'root: "{storage_root}"'
-        updated, count = re.subn(
-            r'(?m)^\s*root:\s*(?:"[^"]*"|\S+)\s*$',
-            root_line,
-            content,
-        )
-        if count == 0:
-            if not updated.endswith("\n"):
-                updated += "\n"
-            updated += root_line + "\n"
-        content = updated
+def _apply_config_edits(content: str, edits: Sequence[ConfigEdit]) -> str:
+    """Apply (pattern, replacement, append_if_missing) edits in one pass per pattern.
 
-        file_storage_conf.write_text(content, encoding="utf-8")
-        log(f"storages/file.conf updated with root: {storage_root}")
+    A replacement may be a callable, so one alternation pattern can rewrite
+    several keys in a single scan; only string replacements can be appended.
+    """
+    for pattern, replacement, append_if_missing in edits:
+        content, count = pattern.subn(replacement, content)
+        if count == 0 and append_if_missing:
+            if not content.endswith("\n"):
+                content += "\n"
+            content += replacement + "\n"
+    return content
 
 
-def write_map_config(glb_cfg: GlobalConfig, map_cfg: MapConfig) -> None:
-    """Write/update map-specific configuration for converted Java world."""
-    map_conf_path = glb_cfg.config_dir / "maps" / \
-        f"{glb_cfg.java_world_dir.name}.conf"
+def _atomic_write(path: Path, data: bytes, mode: int = 0o644) -> None:
+    """Write data to a sibling temp file, fsync it and rename it over path."""
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+    try:
+        with memoryview(data) as view:
+            written = 0
+            while written < len(data):
+                written += os.write(fd, view[written:])
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    os.replace(tmp, path)
 
-    # Check if a sample map config exists that we can use as template
-    maps_dir = glb_cfg.config_dir / "maps"
-    sample_configs = list(maps_dir.glob("*.conf")) if maps_dir.exists() else []
 
-    if sample_configs and not map_conf_path.exists():
-        # Use existing sample as template
-        log(f"Using {sample_configs[0].name} as template for map config")
-        sample_content = sample_configs[0].read_text(encoding="utf-8")
+def _write_if_changed(path: Path, text: str) -> bool:
+    """Write text to path unless the file already holds exactly that content."""
+    data = text.encode("utf-8")
+    mode = 0o644
+    try:
+        if path.read_bytes() == data:
+            return False
+        mode = stat.S_IMODE(path.stat().st_mode)
+    except FileNotFoundError:
+        pass
+    _atomic_write(path, data, mode)
+    return True
+
+
+def _edit_config_file(
+    path: Path,
+    edits: Sequence[ConfigEdit],
+) -> bool:
+    """Apply edits to a config file, writing it only if the content changed."""
+    # One read serves both the edit and the unchanged check
+    with open(path, "rb") as f:
+        original = f.read()
+        mode = stat.S_IMODE(os.fstat(f.fileno()).st_mode)
+    data = _apply_config_edits(original.decode("utf-8"), edits).encode("utf-8")
+    if data == original:
+        return False
+    _atomic_write(path, data, mode)
+    return True
+
+
+# (config file relative to config_dir, line pattern, key, value) for the
+# files that only need their output location pointed at output_path
+_PATH_CONF_TARGETS: tuple[
+    tuple[str, re.Pattern[str], str, Callable[[GlobalConfig], Path]], ...
+] = (
+    ("webserver.conf", _RE_WEBROOT, "webroot", lambda cfg: cfg.output_path),
+    ("webapp.conf", _RE_WEBROOT, "webroot", lambda cfg: cfg.output_path),
+    ("storages/file.conf", _RE_STORAGE_ROOT, "root",
+     lambda cfg: cfg.output_path / "maps"),
+)
+
+
+def _copy_default_configs(src: Path, dst: Path) -> int:
+    """Copy every file under src into dst that dst does not have yet."""
+    copied = 0
+    for root, _, files in os.walk(src):
+        target_dir = dst / Path(root).relative_to(src)
+        target_dir.mkdir(parents=True, exist_ok=True)
+        for name in files:
+            target = target_dir / name
+            if not target.exists():
+                shutil.copy2(os.path.join(root, name), target)
+                copied += 1
+    return copied
 
-        # Update key fields - use Java world path
-        import re
-        sample_content = re.sub(
-            r'id:\s*"[^"]*"', f'id: "{glb_cfg.java_world_dir.name}"', sample_content)
-        sample_content = re.sub(
-            r'name:\s*"[^"]*"', f'name: "{map_cfg.name}"', sample_content)
-        sample_content = re.sub(
-            r'world:\s*"[^"]*"', f'world: "{glb_cfg.java_world_dir}"', sample_content)
-        sample_content, count = re.subn(
-            r'(?m)^\s*ambient-light:\s*[0-9]*\.?[0-9]+\s*$',
-            f'ambient-light: {glb_cfg.ambient_light}',
-            sample_content,
+
+def generate_bluemap_config(glb_cfg: GlobalConfig) -> None:
+    """Generate BlueMap configuration files if they don't exist."""
+    all_confs = [path for path, _, _ in glb_cfg.bluemap_conf_jobs]
+    core_conf = all_confs[0]
+
+    # First time setup - copy the defaults generated at build time, so the
+    # JVM does not have to start just to write them
+    default_configs = glb_cfg.bluemap_jar.with_name(
+        _BLUEMAP_DEFAULT_CONFIG_DIR_NAME)
+    if not core_conf.exists() and (default_configs / "core.conf").exists():
+        copied = _copy_default_configs(default_configs, glb_cfg.config_dir)
+        log(f"Default configuration copied from {default_configs} ({copied} files)")
+
+    # Otherwise let BlueMap generate default configs
+    if not core_conf.exists():
+        log("Generating default BlueMap configuration...")
+        expected = all_confs
+        process = subprocess.Popen(
+            list(glb_cfg.bluemap_cli),
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
         )
-        if count == 0:
-            if not sample_content.endswith("\n"):
-                sample_content += "\n"
-            sample_content += f"ambient-light: {glb_cfg.ambient_light}\n"
+        # Stop as soon as the configs are on disk instead of always
+        # waiting for a fixed timeout
+        deadline = time.monotonic() + 10
+        while process.poll() is None and time.monotonic() < deadline:
+            if all(p.exists() for p in expected):
+                break
+            time.sleep(0.1)
+
+        killed = False
+        if process.poll() is None:
+            try:
+                process.wait(timeout=1)  # let BlueMap finish writing
+            except subprocess.TimeoutExpired:
+                killed = True
+                process.terminate()
+                try:
+                    process.wait(timeout=2)
+                except subprocess.TimeoutExpired:
+                    process.kill()
+                    process.wait()
+                log("WARNING: BlueMap did not exit while generating the "
+                    "default configuration and was killed",
+                    level=logging.WARNING)
+
+        missing = [p for p in expected if not p.exists()]
+        if missing:
+            log("WARNING: Default configuration incomplete, missing: "
+                + ", ".join(str(p.relative_to(glb_cfg.config_dir))
+                            for p in missing),
+                level=logging.WARNING)
+        elif killed or process.returncode == 0:
+            log("Default configuration generated")
+        else:
+            log("Default configuration generated "
+                f"(BlueMap exited with code {process.returncode})")
+
+    cache_key = (str(glb_cfg.config_dir), str(glb_cfg.output_path),
+                 glb_cfg.render_threads)
+    signature = _stat_signature(all_confs)
+    if signature is not None and _config_cache.get(cache_key) == signature:
+        log("BlueMap configuration unchanged since last cycle")
+        return
 
-        map_conf_path.write_text(sample_content, encoding="utf-8")
-        log(f"Map configuration written to {map_conf_path} (from template)")
+    # The files are independent, so they are edited concurrently and
+    # reported in order afterwards
+    jobs = [job for job in glb_cfg.bluemap_conf_jobs if job[0].exists()]
+    if not jobs:
         return
 
-    # TODO: Calculate view distances based on world size or other heuristics
-    lowres_view_distance = glb_cfg.render_threads * 2
-    hires_view_distance = lowres_view_distance * 2
+    log("Updating BlueMap configuration files...")
+    with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+        changed = list(executor.map(
+            lambda job: _edit_config_file(job[0], job[1]), jobs))
+
+    for (path, _, message), was_changed in zip(jobs, changed):
+        if was_changed:
+            log(message)
+        else:
+            log(f"{path.relative_to(glb_cfg.config_dir)} already up to date",
+                level=logging.DEBUG)
+
+    signature = _stat_signature(all_confs)
+    if signature is not None:
+        _config_cache[cache_key] = signature
 
-    config_content = f'''##                          ##
+
+_MAP_CONF_TEMPLATE = '''##                          ##
 ##         BlueMap          ##
 ##        Map-Config        ##
 ##                          ##
 
 # The id of this map
-id: "{glb_cfg.java_world_dir.name}"
+id: "{id}"
 
 # The display name of this map  
-name: "{map_cfg.name}"
+name: "{name}"
 
 # The world/save-folder of this map (converted from Bedrock)
-world: "{glb_cfg.java_world_dir}"
+world: "{world}"
 
 # The dimension of the world
 dimension: "minecraft:overworld"
@@ -364,7 +1394,7 @@ start-pos: {{x: 0, z: 0}}
 sky-color: "#7dabff"
 
 # Defines the ambient light
-ambient-light: {glb_cfg.ambient_light}
+ambient-light: {ambient_light}
 
 # Defines the view-distance for hires tiles
 hires-view-distance: {hires_view_distance}
@@ -379,11 +1409,74 @@ render-edges: true
 save-hires-layer: true
 
 # Remove caves below this Y-level (Bedrock typically uses -64)
-remove-caves-below-y: {map_cfg.min_y}
+remove-caves-below-y: {min_y}
 '''
 
-    map_conf_path.write_text(config_content, encoding="utf-8")
-    log(f"Map configuration written to {map_conf_path}")
+
+def write_map_config(glb_cfg: GlobalConfig, map_cfg: MapConfig) -> None:
+    """Write/update map-specific configuration for converted Java world."""
+    map_conf_path = glb_cfg.config_dir / "maps" / \
+        f"{glb_cfg.java_world_dir.name}.conf"
+
+    cache_key = (str(map_conf_path), map_cfg.name, map_cfg.min_y,
+                 glb_cfg.ambient_light, glb_cfg.render_threads)
+    signature = _stat_signature((map_conf_path,))
+    if signature is not None and _config_cache.get(cache_key) == signature:
+        log(f"Map configuration unchanged: {map_conf_path}")
+        return
+
+    # Check if a sample map config exists that we can use as template
+    maps_dir = glb_cfg.config_dir / "maps"
+    sample_configs = list(maps_dir.glob("*.conf")) if maps_dir.exists() else []
+
+    if sample_configs and not map_conf_path.exists():
+        # Use existing sample as template
+        log(f"Using {sample_configs[0].name} as template for map config")
+        sample_content = sample_configs[0].read_text(encoding="utf-8")
+
+        # Update key fields - use Java world path
+        fields = {
+            "id": f'id: "{glb_cfg.java_world_dir.name}"',
+            "name": f'name: "{map_cfg.name}"',
+            "world": f'world: "{glb_cfg.java_world_dir}"',
+            "ambient-light": f'ambient-light: {glb_cfg.ambient_light}',
+        }
+        seen = set()
+
+        def replace_field(match: re.Match[str]) -> str:
+            key = match.group(1) or match.group(2)
+            seen.add(key)
+            return fields[key]
+
+        sample_content = _RE_MAP_FIELDS.sub(replace_field, sample_content)
+        if "ambient-light" not in seen:
+            if not sample_content.endswith("\n"):
+                sample_content += "\n"
+            sample_content += fields["ambient-light"] + "\n"
+
+        _write_if_changed(map_conf_path, sample_content)
+        log(f"Map configuration written to {map_conf_path} (from template)")
+        return
+
+    # TODO: Calculate view distances based on world size or other heuristics
+    lowres_view_distance = glb_cfg.render_threads * 2
+    hires_view_distance = lowres_view_distance * 2
+
+    config_content = _MAP_CONF_TEMPLATE.format_map({
+        "id": glb_cfg.java_world_dir.name,
+        "name": map_cfg.name,
+        "world": glb_cfg.java_world_dir,
+        "ambient_light": glb_cfg.ambient_light,
+        "hires_view_distance": hires_view_distance,
+        "lowres_view_distance": lowres_view_distance,
+        "min_y": map_cfg.min_y,
+    })
+
+    if _write_if_changed(map_conf_path, config_content):
+        log(f"Map configuration written to {map_conf_path}")
+    else:
+        log(f"Map configuration unchanged: {map_conf_path}")
+    _config_cache[cache_key] = _stat_signature((map_conf_path,))
 
 
 def render_map(glb_cfg: GlobalConfig) -> None:
@@ -391,47 +1484,29 @@ def render_map(glb_cfg: GlobalConfig) -> None:
     log("Starting BlueMap render...")
 
     cmd = [
-        "java", "-jar", str(glb_cfg.bluemap_jar),
-        "-c", str(glb_cfg.config_dir),
+        *glb_cfg.bluemap_cli,
         "-r",  # render
-        "-f",  # force render
     ]
+    if not glb_cfg.incremental_convert:
+        # An incrementally updated world only touches changed region files,
+        # which BlueMap picks up without re-rendering everything
+        cmd.append("-f")  # force render
 
-    try:
-        result = subprocess.run(
-            cmd,
-            check=True,
-            capture_output=True,
-            text=True
-        )
+    returncode = run_tool(cmd, glb_cfg.raw_tool_output)
+    if returncode:
+        log(f"ERROR: BlueMap render failed with exit code {returncode}",
+            level=logging.ERROR)
+        raise subprocess.CalledProcessError(returncode, cmd)
 
-        # Log output
-        if result.stdout:
-            for line in result.stdout.strip().split('\n'):
-                log(f"  {line}")
-
-        log("Render complete!")
-
-    except subprocess.CalledProcessError as e:
-        log(f"ERROR: BlueMap render failed with exit code {e.returncode}")
-        if e.stdout:
-            log("STDOUT:")
-            for line in e.stdout.strip().split('\n'):
-                log(f"  {line}")
-        if e.stderr:
-            log("STDERR:")
-            for line in e.stderr.strip().split('\n'):
-                log(f"  {line}")
-        raise
+    log("Render complete!")
 
 
-def start_bluemap(glb_cfg: GlobalConfig) -> None:
-    """Start BlueMap with rendering and built-in webserver."""
+def start_bluemap(glb_cfg: GlobalConfig) -> NoReturn:
+    """Replace this process with BlueMap rendering and running its webserver."""
     log("Starting BlueMap with integrated webserver...")
 
     cmd = [
-        "java", "-jar", str(glb_cfg.bluemap_jar),
-        "-c", str(glb_cfg.config_dir),
+        *glb_cfg.bluemap_cli,
         "-r",  # render once
         "-w",  # start webserver
     ]
@@ -440,27 +1515,55 @@ def start_bluemap(glb_cfg: GlobalConfig) -> None:
     log("BlueMap will render the map and then start the webserver")
     log("Press Ctrl+C to stop")
 
-    try:
-        # Run in foreground - this will block until interrupted
-        subprocess.run(cmd, check=True)
-    except KeyboardInterrupt:
-        log("Received interrupt, shutting down...")
-    except subprocess.CalledProcessError as e:
-        log(f"ERROR: BlueMap failed with exit code {e.returncode}")
-        raise
+    # exec skips atexit handlers and kills daemon threads, so finish the
+    # cleanup they would have done first
+    discard_snapshot()
+    wait_for_background_deletions()
+    sys.stdout.flush()
+    sys.stderr.flush()
+
+    # The JVM takes over this PID, so it receives signals directly and the
+    # interpreter's memory is released for the lifetime of the webserver
+    os.execvp(cmd[0], cmd)
 
 
 def start_bluemap_webserver_process(glb_cfg: GlobalConfig) -> subprocess.Popen[str]:
     """Start BlueMap webserver in background and return process handle."""
     cmd = [
-        "java", "-jar", str(glb_cfg.bluemap_jar),
-        "-c", str(glb_cfg.config_dir),
+        *glb_cfg.bluemap_cli,
         "-w",  # start webserver only (render happens before launch)
     ]
     log(f"Starting BlueMap webserver process: {' '.join(str(c) for c in cmd)}")
     return subprocess.Popen(cmd)
 
 
+def _wait_for_exit(process: subprocess.Popen[str], timeout: float) -> bool:
+    """Wait up to timeout for process to exit; return whether it did.
+
+    On Linux a pidfd becomes readable the moment the child exits, so the
+    wait returns immediately instead of in Popen.wait()'s polling steps.
+    """
+    pidfd = None
+    if hasattr(os, "pidfd_open"):
+        try:
+            pidfd = os.pidfd_open(process.pid)
+        except OSError:
+            pass
+    if pidfd is not None:
+        try:
+            ready, _, _ = select.select([pidfd], [], [], timeout)
+        finally:
+            os.close(pidfd)
+        if not ready:
+            return False
+        timeout = 1  # already exited; this only reaps it
+    try:
+        process.wait(timeout=timeout)
+        return True
+    except subprocess.TimeoutExpired:
+        return False
+
+
 def stop_bluemap_process(process: subprocess.Popen[str] | None) -> None:
     """Stop BlueMap child process gracefully, then force kill if needed."""
     if process is None:
@@ -471,21 +1574,62 @@ def stop_bluemap_process(process: subprocess.Popen[str] | None) -> None:
 
     log("Stopping BlueMap webserver process...")
     process.terminate()
-    try:
-        process.wait(timeout=30)
+    if _wait_for_exit(process, 30):
         log("BlueMap webserver stopped")
-    except subprocess.TimeoutExpired:
+    else:
         log("BlueMap did not exit in time; killing process")
         process.kill()
         process.wait(timeout=10)
 
 
 def run_refresh_cycle(glb_cfg: GlobalConfig) -> None:
-    """Run one full conversion/config/render cycle."""
+    """Run one conversion/config cycle; the caller decides how to render."""
     map_cfg = convert_bedrock_map_to_java_map(glb_cfg)
     generate_bluemap_config(glb_cfg)
     write_map_config(glb_cfg, map_cfg)
-    render_map(glb_cfg)
+
+
+class _RenderTriggerHandler(BaseHTTPRequestHandler):
+    """Wake the refresh loop on POST /render."""
+
+    server: _RenderTriggerServer
+
+    def do_POST(self) -> None:
+        if self.path.split("?", 1)[0] != "/render":
+            self.send_error(404)
+            return
+        self.server.render_requested.set()
+        self.send_response(202)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format: str, *args: Any) -> None:
+        log("Trigger request: " + format, *args, level=logging.DEBUG)
+
+
+class _RenderTriggerServer(ThreadingHTTPServer):
+    """HTTP server carrying the event its handler sets."""
+
+    daemon_threads = True
+
+    def __init__(self, port: int, render_requested: threading.Event) -> None:
+        super().__init__(("127.0.0.1", port), _RenderTriggerHandler)
+        self.render_requested = render_requested
+
+
+def start_render_trigger(port: int,
+                         render_requested: threading.Event) -> _RenderTriggerServer | None:
+    """Serve POST /render on localhost in a daemon thread, or None if it cannot bind."""
+    try:
+        server = _RenderTriggerServer(port, render_requested)
+    except OSError as e:
+        log(f"WARNING: Render trigger disabled, cannot listen on port {port}: {e}",
+            level=logging.WARNING)
+        return None
+    threading.Thread(target=server.serve_forever,
+                     name="render-trigger", daemon=True).start()
+    log(f"Render trigger listening at http://127.0.0.1:{port}/render (POST)")
+    return server
 
 
 def run_periodic_refresh_service(glb_cfg: GlobalConfig) -> None:
@@ -494,44 +1638,87 @@ def run_periodic_refresh_service(glb_cfg: GlobalConfig) -> None:
         raise ValueError(
             "render-interval must be > 0 for periodic refresh service")
 
-    log("=" * 60)
-    log("Starting periodic refresh service")
-    log("Strategy: stop BlueMap -> convert Bedrock to Java -> render -> restart webserver")
-    log(f"Refresh interval: {glb_cfg.render_interval}s")
-    log("Press Ctrl+C to stop")
-    log("=" * 60)
+    log_many([
+        "=" * 60,
+        "Starting periodic refresh service",
+        "Strategy: stop BlueMap -> convert Bedrock to Java -> render -> restart webserver",
+        f"Refresh interval: {glb_cfg.render_interval}s",
+        "Press Ctrl+C to stop",
+        "=" * 60,
+    ])
 
     bluemap_process: subprocess.Popen[str] | None = None
+    render_requested = threading.Event()
+    trigger = (start_render_trigger(glb_cfg.trigger_port, render_requested)
+               if glb_cfg.trigger_port > 0 else None)
 
     try:
         log("Running initial conversion and render...")
+        signature = bedrock_world_signature(glb_cfg.bedrock_world_dir)
         run_refresh_cycle(glb_cfg)
+        render_map(glb_cfg)
+        # World signature the served map was last rendered from
+        rendered_signature: tuple | None = signature
         bluemap_process = start_bluemap_webserver_process(glb_cfg)
         log("Web interface available at http://localhost:8100")
 
+        # Cycles start on a fixed cadence rather than interval seconds after
+        # the previous one finished, so long renders do not make it drift
+        interval = glb_cfg.render_interval
+        next_deadline = time.monotonic() + interval
         while True:
-            time.sleep(glb_cfg.render_interval)
-            log("Starting scheduled refresh cycle...")
+            now = time.monotonic()
+            # After a stall, run one catch-up cycle instead of one per missed slot
+            while next_deadline + interval <= now:
+                next_deadline += interval
+            requested = render_requested.wait(max(0.0, next_deadline - now))
+            render_requested.clear()
+            if requested:
+                log("Starting requested refresh cycle...")
+                next_deadline = time.monotonic() + interval
+            else:
+                log("Starting scheduled refresh cycle...")
+                next_deadline += interval
+
+            # The configs are fixed for the life of the process, so an
+            # unchanged world means BlueMap would render the same map again;
+            # an explicit request always renders
+            signature = bedrock_world_signature(glb_cfg.bedrock_world_dir)
+            if (not requested
+                    and bluemap_process is not None
+                    and bluemap_process.poll() is None
+                    and signature == rendered_signature):
+                log("No changes detected, skipping render")
+                continue
 
             stop_bluemap_process(bluemap_process)
             bluemap_process = None
 
+            # The render blocks until it finishes, so a slow render is never
+            # interrupted and restarted by the next cycle
+            rendered_signature = None
             try:
                 run_refresh_cycle(glb_cfg)
+                render_map(glb_cfg)
+                rendered_signature = signature
             except Exception as e:
-                log(f"ERROR during refresh cycle: {e}")
+                log(f"ERROR during refresh cycle: {e}", level=logging.ERROR)
                 log("Will retry after next interval")
 
             try:
                 bluemap_process = start_bluemap_webserver_process(glb_cfg)
             except Exception as e:
                 log(
-                    f"ERROR: Failed to start BlueMap webserver after refresh: {e}")
+                    f"ERROR: Failed to start BlueMap webserver after refresh: {e}",
+                    level=logging.ERROR)
                 log("Will retry webserver start on next interval")
 
     except KeyboardInterrupt:
         log("Received interrupt, shutting down periodic refresh service...")
     finally:
+        if trigger is not None:
+            trigger.shutdown()
+            trigger.server_close()
         stop_bluemap_process(bluemap_process)
 
 
@@ -571,7 +1758,20 @@ def main(argv: Sequence[str] | None = None) -> int:
         type=int,
         # 10 minutes default
         default=int(os.getenv("RENDER_INTERVAL", "600")),
-        help="Seconds between automatic re-renders",
+        help="Seconds between automatic re-renders (0 = convert and render once, then keep serving)",
+    )
+    parser.add_argument(
+        "--render-once",
+        action=argparse.BooleanOptionalAction,
+        default=os.getenv("RENDER_ONCE", "false").lower()
+        in ("1", "true", "yes"),
+        help="Convert and render a single time, then exit without starting the webserver",
+    )
+    parser.add_argument(
+        "--trigger-port",
+        type=int,
+        default=int(os.getenv("TRIGGER_PORT", "8101")),
+        help="Localhost port accepting POST /render to refresh before the interval ends (0 = disabled)",
     )
     parser.add_argument(
         "--ambient-light",
@@ -584,8 +1784,87 @@ def main(argv: Sequence[str] | None = None) -> int:
         default=os.getenv("BLUEMAP_JAR", "/opt/bluemap/BlueMap-cli.jar"),
         help="Path to BlueMap CLI JAR file",
     )
+    parser.add_argument(
+        "--snapshot-workers",
+        type=int,
+        default=int(os.getenv("SNAPSHOT_WORKERS",
+                              str(min(32, (os.cpu_count() or 4) * 4)))),
+        help="Number of threads used to snapshot a read-only Bedrock world",
+    )
+    parser.add_argument(
+        "--parallel-convert",
+        action=argparse.BooleanOptionalAction,
+        default=os.getenv("PARALLEL_CONVERT", "false").lower()
+        in ("1", "true", "yes"),
+        help="Overlap Bedrock chunk reads with Java chunk writes during conversion",
+    )
+    parser.add_argument(
+        "--convert-writers",
+        type=int,
+        default=int(os.getenv("CONVERT_WRITERS", "1")),
+        help="Number of chunk writer threads used by --parallel-convert (commits are serialized)",
+    )
+    parser.add_argument(
+        "--incremental-convert",
+        action=argparse.BooleanOptionalAction,
+        default=os.getenv("INCREMENTAL_CONVERT", "false").lower()
+        in ("1", "true", "yes"),
+        help="Keep the Java world between cycles and only re-convert chunks whose Bedrock data changed",
+    )
+    parser.add_argument(
+        "--converter",
+        choices=("amulet", "chunker"),
+        default=os.getenv("CONVERTER", "amulet"),
+        help="Bedrock to Java converter: Amulet (in-process) or the Chunker CLI",
+    )
+    parser.add_argument(
+        "--chunker-jar",
+        default=os.getenv("CHUNKER_JAR", "/opt/chunker/chunker-cli.jar"),
+        help="Path to the Chunker CLI JAR (used with --converter chunker)",
+    )
+    parser.add_argument(
+        "--chunker-format",
+        default=os.getenv("CHUNKER_FORMAT", "JAVA_1_21"),
+        help="Chunker output format (used with --converter chunker)",
+    )
+    parser.add_argument(
+        "--all-dimensions",
+        action=argparse.BooleanOptionalAction,
+        default=os.getenv("ALL_DIMENSIONS", "false").lower()
+        in ("1", "true", "yes"),
+        help="Convert the Nether and End too, not just the Overworld",
+    )
+
+    parser.add_argument(
+        "--raw-tool-output",
+        action=argparse.BooleanOptionalAction,
+        default=os.getenv("RAW_TOOL_OUTPUT", "false").lower()
+        in ("1", "true", "yes"),
+        help="Let BlueMap renders and Chunker write to stdout directly instead of re-logging each line",
+    )
+    verbosity = parser.add_mutually_exclusive_group()
+    verbosity.add_argument(
+        "-v", "--verbose",
+        dest="log_level",
+        action="store_const",
+        const="DEBUG",
+        help="Also log debug messages",
+    )
+    verbosity.add_argument(
+        "-q", "--quiet",
+        dest="log_level",
+        action="store_const",
+        const="WARNING",
+        help="Only log warnings and errors",
+    )
+    parser.set_defaults(log_level=os.getenv("LOG_LEVEL", "INFO").upper())
 
     args = parser.parse_args(argv)
+    log_levels = ("DEBUG", "INFO", "WARNING", "ERROR")
+    if args.log_level not in log_levels:
+        parser.error(f"invalid LOG_LEVEL {args.log_level!r} "
+                     f"(choose from {', '.join(log_levels)})")
+    logger.setLevel(args.log_level)
 
     bedrock_world_dir = Path(args.bedrock_world_dir)
     output_path = normalize_output_path(Path(args.output_path))
@@ -601,26 +1880,52 @@ def main(argv: Sequence[str] | None = None) -> int:
         render_threads=args.render_threads,
         render_interval=args.render_interval,
         ambient_light=args.ambient_light,
+        snapshot_workers=args.snapshot_workers,
+        parallel_convert=args.parallel_convert,
+        convert_writers=args.convert_writers,
+        incremental_convert=args.incremental_convert,
+        all_dimensions=args.all_dimensions,
+        converter=args.converter,
+        chunker_jar=Path(args.chunker_jar),
+        chunker_format=args.chunker_format,
+        raw_tool_output=args.raw_tool_output,
+        trigger_port=args.trigger_port,
     )
 
-    log("=" * 60)
-    log("BlueMap Mapper for Minecraft Bedrock")
-    log("=" * 60)
-    log(f"Bedrock world: {glb_cfg.bedrock_world_dir}")
-    log(f"Java world (converted): {glb_cfg.java_world_dir}")
-    log(f"Output path: {glb_cfg.output_path}")
-    log(f"Config dir: {glb_cfg.config_dir}")
-    log(f"BlueMap JAR: {glb_cfg.bluemap_jar}")
-    log(f"Render threads: {glb_cfg.render_threads}")
-    log(f"Ambient light: {glb_cfg.ambient_light}")
-    log("=" * 60)
+    log_many([
+        "=" * 60,
+        "BlueMap Mapper for Minecraft Bedrock",
+        "=" * 60,
+        f"Bedrock world: {glb_cfg.bedrock_world_dir}",
+        f"Java world (converted): {glb_cfg.java_world_dir}",
+        f"Output path: {glb_cfg.output_path}",
+        f"Config dir: {glb_cfg.config_dir}",
+        f"BlueMap JAR: {glb_cfg.bluemap_jar}",
+        f"Render threads: {glb_cfg.render_threads}",
+        f"Ambient light: {glb_cfg.ambient_light}",
+        f"Snapshot workers: {glb_cfg.snapshot_workers}",
+        f"Parallel convert: {glb_cfg.parallel_convert}",
+        f"Convert writers: {glb_cfg.convert_writers}",
+        f"Incremental convert: {glb_cfg.incremental_convert}",
+        f"All dimensions: {glb_cfg.all_dimensions}",
+        f"Converter: {glb_cfg.converter}",
+        "=" * 60,
+    ])
 
     # Setup
     ensure_directories(glb_cfg)
     validate_environment(glb_cfg)
 
-    # Run periodic conversion/render with managed BlueMap webserver restarts
-    run_periodic_refresh_service(glb_cfg)
+    if args.render_once:
+        run_refresh_cycle(glb_cfg)
+        render_map(glb_cfg)
+    elif glb_cfg.render_interval <= 0:
+        # No refreshes: a single long-lived BlueMap renders and then serves
+        run_refresh_cycle(glb_cfg)
+        start_bluemap(glb_cfg)
+    else:
+        # Run periodic conversion/render with managed BlueMap webserver restarts
+        run_periodic_refresh_service(glb_cfg)
 
     return 0
 
@@ -632,7 +1937,6 @@ if __name__ == "__main__":
         log("Received interrupt signal, shutting down...")
         raise SystemExit(0)
     except Exception as e:
-        log(f"FATAL ERROR: {e}")
-        import traceback
+        log(f"FATAL ERROR: {e}", level=logging.ERROR)
         traceback.print_exc()
         raise SystemExit(1)
@@ -0,0 +1,60 @@
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import mapper  # noqa: E402
+
+
+class ChunkDoesNotExist(Exception):
+    pass
+
+
+class ChunkLoadError(Exception):
+    pass
+
+
+@pytest.fixture(autouse=True)
+def amulet_stubs(monkeypatch):
+    """Bind the names _load_amulet() would import, without Amulet installed."""
+    monkeypatch.setattr(mapper, "ChunkDoesNotExist", ChunkDoesNotExist)
+    monkeypatch.setattr(mapper, "ChunkLoadError", ChunkLoadError)
+    monkeypatch.setattr(mapper, "StatusFormats",
+                        types.SimpleNamespace(Java_14="java_14"))
+
+
+@pytest.fixture(autouse=True)
+def fresh_config_cache(monkeypatch):
+    monkeypatch.setattr(mapper, "_config_cache", {})
+
+
+@pytest.fixture
+def make_glb_cfg(tmp_path):
+    """Build a GlobalConfig rooted in tmp_path, with keyword overrides."""
+    def make(**overrides):
+        fields = dict(
+            bedrock_world_dir=tmp_path / "bedrock" / "world",
+            java_world_dir=tmp_path / "java_world",
+            output_path=tmp_path / "webroot",
+            config_dir=tmp_path / "config",
+            bluemap_jar=tmp_path / "bluemap" / "BlueMap-cli.jar",
+            render_threads=3,
+            render_interval=600,
+            ambient_light=0.5,
+            snapshot_workers=2,
+            parallel_convert=False,
+            convert_writers=1,
+            incremental_convert=False,
+            all_dimensions=False,
+            converter="amulet",
+            chunker_jar=tmp_path / "chunker.jar",
+            chunker_format="JAVA_1_21",
+            raw_tool_output=False,
+            trigger_port=0,
+        )
+        fields.update(overrides)
+        return mapper.GlobalConfig(**fields)
+    return make
@@ -0,0 +1,161 @@
+"""In-memory stand-ins for the parts of Amulet the converters use."""
+import os
+import threading
+import time
+import types
+
+from conftest import ChunkDoesNotExist, ChunkLoadError
+
+
+class FakeStatus:
+    def __init__(self, value):
+        self.value = value
+
+    def as_type(self, _format):
+        return self.value
+
+
+class FakeChunk:
+    def __init__(self, cx, cz, data, status="full"):
+        self.cx = cx
+        self.cz = cz
+        self.data = data
+        self.status = FakeStatus(status)
+
+
+class FakeLevelWrapper:
+    translation_manager = object()
+    level_name = "Test World"
+    platform = "bedrock"
+    game_version_string = "Bedrock 1.21.0"
+    version = (1, 21, 0)
+
+    def __init__(self, world):
+        self.world = world
+        self.unreadable = set()
+
+    def load_chunk(self, cx, cz, dimension):
+        key = (dimension, cx, cz)
+        if key not in self.world.chunks:
+            raise ChunkDoesNotExist(key)
+        return FakeChunk(cx, cz, self.world.chunks[key],
+                         self.world.statuses.get(key, "full"))
+
+    def get_raw_chunk_data(self, cx, cz, dimension):
+        key = (dimension, cx, cz)
+        if key in self.unreadable:
+            raise ChunkLoadError(key)
+        if key not in self.world.chunks:
+            raise ChunkDoesNotExist(key)
+        return {b"/": self.world.chunks[key], b"-": None}
+
+    def unload(self):
+        pass
+
+
+class FakeBedrockWorld:
+    """Bedrock level holding {(dimension, cx, cz): chunk bytes}."""
+
+    def __init__(self, chunks, statuses=None):
+        self.chunks = dict(chunks)
+        self.statuses = dict(statuses or {})
+        self.dimensions = sorted({key[0] for key in self.chunks})
+        self.level_wrapper = FakeLevelWrapper(self)
+
+    def all_chunk_coords(self, dimension):
+        return [(cx, cz) for d, cx, cz in self.chunks if d == dimension]
+
+    def get_chunk(self, cx, cz, dimension):
+        raise AssertionError("converters must not use the level history")
+
+    def bounds(self, dimension):
+        return types.SimpleNamespace(min_y=-64, max_y=320)
+
+    def close(self):
+        pass
+
+
+class FakeAnvilWrapper:
+    """Java wrapper that, like Amulet's, is not safe for concurrent commits.
+
+    Amulet's commit_chunk logs and swallows its own errors, so a commit
+    that overlaps another one silently drops the chunk here too.
+    """
+
+    def __init__(self, dimensions=("overworld",), chunks=None):
+        self.dimensions = list(dimensions)
+        self.chunks = dict(chunks or {})
+        self.buffer = {}
+        self.translation_manager = None
+        self.saves = 0
+        self._active = 0
+        self._active_lock = threading.Lock()
+
+    def commit_chunk(self, chunk, dimension):
+        with self._active_lock:
+            self._active += 1
+            overlapping = self._active > 1
+        try:
+            time.sleep(0.0002)  # the window in which Amulet re-reads its session lock
+            with self._active_lock:
+                overlapping = overlapping or self._active > 1
+            if overlapping:
+                raise RuntimeError("session lock has been lost")
+            self.buffer[(dimension, chunk.cx, chunk.cz)] = chunk.data
+        except Exception:
+            pass
+        finally:
+            with self._active_lock:
+                self._active -= 1
+
+    def delete_chunk(self, cx, cz, dimension):
+        self.buffer[(dimension, cx, cz)] = None
+
+    def has_chunk(self, cx, cz, dimension):
+        key = (dimension, cx, cz)
+        if key in self.buffer:
+            return self.buffer[key] is not None
+        return key in self.chunks
+
+    def save(self):
+        for key, data in self.buffer.items():
+            if data is None:
+                self.chunks.pop(key, None)
+            else:
+                self.chunks[key] = data
+        self.buffer.clear()
+        self.saves += 1
+
+    def unload(self):
+        pass
+
+
+def anvil_format_class():
+    """An AnvilFormat stand-in whose worlds persist per path across instances."""
+    worlds = {}
+
+    class FakeAnvilFormat(FakeAnvilWrapper):
+        def __init__(self, path):
+            super().__init__(dimensions=("overworld", "nether"))
+            self.path = path
+
+        def create_and_open(self, platform, version, overwrite=False):
+            os.makedirs(self.path, exist_ok=True)
+            self.chunks = worlds[self.path] = {}
+
+        def open(self):
+            self.chunks = worlds[self.path]
+
+        def close(self):
+            pass
+
+    FakeAnvilFormat.worlds = worlds
+    return FakeAnvilFormat
+
+
+def make_world(count, dimension="overworld", width=30):
+    """A Bedrock world of count chunks spread over several regions."""
+    return FakeBedrockWorld({
+        (dimension, (i % width) * 7 - 100, (i // width) * 9 - 30): b"chunk %d" % i
+        for i in range(count)
+    })
@@ -0,0 +1,108 @@
+import mapper
+
+# Trimmed copies of the files BlueMap writes on first start
+DEFAULT_CONFIGS = {
+    "core.conf": (
+        "# BlueMap core settings\n"
+        "accept-download: false\n"
+        "render-thread-count: 1\n"
+        "metrics: true\n"
+    ),
+    "webserver.conf": 'enabled: true\nwebroot: "bluemap/web"\nport: 8100\n',
+    "webapp.conf": 'enabled: true\nwebroot: "bluemap/web"\nuse-cookies: true\n',
+    "storages/file.conf": 'storage-type: FILE\nroot: "bluemap/web/maps"\ncompression: gzip\n',
+}
+
+
+def install_default_configs(glb_cfg):
+    default_dir = glb_cfg.bluemap_jar.with_name(mapper._BLUEMAP_DEFAULT_CONFIG_DIR_NAME)
+    for rel, content in DEFAULT_CONFIGS.items():
+        path = default_dir / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+
+
+def snapshot(config_dir):
+    return {
+        p.relative_to(config_dir).as_posix(): (p.read_text(), p.stat().st_mtime_ns)
+        for p in sorted(config_dir.rglob("*.conf"))
+    }
+
+
+def test_generate_applies_settings_to_default_configs(make_glb_cfg):
+    glb_cfg = make_glb_cfg()
+    glb_cfg.config_dir.mkdir()
+    install_default_configs(glb_cfg)
+
+    mapper.generate_bluemap_config(glb_cfg)
+
+    conf = glb_cfg.config_dir
+    assert (conf / "core.conf").read_text() == (
+        "# BlueMap core settings\n"
+        "accept-download: true\n"
+        "render-thread-count: 3\n"
+        "metrics: true\n"
+    )
+    assert f'webroot: "{glb_cfg.output_path}"\n' in (conf / "webserver.conf").read_text()
+    assert f'webroot: "{glb_cfg.output_path}"\n' in (conf / "webapp.conf").read_text()
+    assert (conf / "storages" / "file.conf").read_text() == (
+        f'storage-type: FILE\nroot: "{glb_cfg.output_path / "maps"}"\ncompression: gzip\n'
+    )
+
+
+def test_generate_is_idempotent(make_glb_cfg, monkeypatch):
+    glb_cfg = make_glb_cfg()
+    glb_cfg.config_dir.mkdir()
+    install_default_configs(glb_cfg)
+    mapper.generate_bluemap_config(glb_cfg)
+    first = snapshot(glb_cfg.config_dir)
+
+    # Same process: served from the stat-signature cache
+    mapper.generate_bluemap_config(glb_cfg)
+    assert snapshot(glb_cfg.config_dir) == first
+
+    # Uncached (e.g. a new process): re-edited, but nothing is rewritten
+    monkeypatch.setattr(mapper, "_config_cache", {})
+    mapper.generate_bluemap_config(glb_cfg)
+    assert snapshot(glb_cfg.config_dir) == first
+
+
+def test_generate_reapplies_settings_after_external_edits(make_glb_cfg):
+    glb_cfg = make_glb_cfg()
+    glb_cfg.config_dir.mkdir()
+    install_default_configs(glb_cfg)
+    mapper.generate_bluemap_config(glb_cfg)
+
+    webapp = glb_cfg.config_dir / "webapp.conf"
+    webapp.write_text('enabled: true\nwebroot: elsewhere\nuse-cookies: false\n')
+    mapper.generate_bluemap_config(glb_cfg)
+
+    assert webapp.read_text() == (
+        f'enabled: true\nwebroot: "{glb_cfg.output_path}"\nuse-cookies: false\n'
+    )
+
+
+def test_missing_path_settings_are_appended():
+    content = mapper._apply_config_edits(
+        "enabled: true", ((mapper._RE_WEBROOT, 'webroot: "/webroot"', True),))
+    assert content == 'enabled: true\nwebroot: "/webroot"\n'
+
+
+def test_map_config_is_written_once(make_glb_cfg, monkeypatch):
+    glb_cfg = make_glb_cfg()
+    (glb_cfg.config_dir / "maps").mkdir(parents=True)
+    map_cfg = mapper.MapConfig(name="My World", min_y=-64, max_y=320)
+
+    mapper.write_map_config(glb_cfg, map_cfg)
+    path = glb_cfg.config_dir / "maps" / "java_world.conf"
+    content = path.read_text()
+    assert 'id: "java_world"' in content
+    assert 'name: "My World"' in content
+    assert f'world: "{glb_cfg.java_world_dir}"' in content
+    assert "ambient-light: 0.5" in content
+    first = snapshot(glb_cfg.config_dir)
+
+    mapper.write_map_config(glb_cfg, map_cfg)
+    monkeypatch.setattr(mapper, "_config_cache", {})
+    mapper.write_map_config(glb_cfg, map_cfg)
+    assert snapshot(glb_cfg.config_dir) == first
@@ -0,0 +1,60 @@
+import pytest
+
+import mapper
+from fakes import FakeAnvilWrapper, make_world
+
+
+@pytest.mark.parametrize("writers", [1, 3, 4])
+def test_pipelined_conversion_keeps_every_chunk(monkeypatch, writers):
+    monkeypatch.setattr(mapper, "_CONVERT_BATCH_SIZE", 4)
+    monkeypatch.setattr(mapper, "_CONVERT_FLUSH_INTERVAL", 50)
+    world = make_world(210)
+    java = FakeAnvilWrapper()
+    jobs = mapper._chunk_jobs(world, java, ["overworld"])
+
+    mapper.convert_chunks_pipelined(world, java, jobs, lambda i, n: None,
+                                    writers=writers)
+
+    assert set(java.chunks) == set(world.chunks)
+    assert java.translation_manager is world.level_wrapper.translation_manager
+
+
+class FailingAnvilWrapper(FakeAnvilWrapper):
+    """Swallows the commit of chosen chunks, as Amulet does on errors."""
+
+    def __init__(self, failing):
+        super().__init__()
+        self.failing = set(failing)
+
+    def commit_chunk(self, chunk, dimension):
+        if (dimension, chunk.cx, chunk.cz) not in self.failing:
+            super().commit_chunk(chunk, dimension)
+
+
+@pytest.mark.parametrize("pipelined", [False, True])
+def test_conversion_reports_swallowed_commit_failures(caplog, pipelined):
+    world = make_world(40)
+    failing = sorted(world.chunks)[:3]
+    java = FailingAnvilWrapper(failing)
+    jobs = mapper._chunk_jobs(world, java, ["overworld"])
+
+    if pipelined:
+        missing = mapper.convert_chunks_pipelined(
+            world, java, jobs, lambda i, n: None, writers=2)
+    else:
+        missing = mapper.convert_chunks(world, java, jobs, lambda i, n: None)
+
+    assert sorted(missing) == failing
+    assert len(java.chunks) == 37
+    assert "3 of 40 converted chunks were not written" in caplog.text
+
+
+def test_conversion_skips_chunks_that_are_not_fully_generated():
+    world = make_world(10)
+    proto = sorted(world.chunks)[0]
+    world.statuses[proto] = "structure_starts"
+    java = FakeAnvilWrapper()
+    jobs = mapper._chunk_jobs(world, java, ["overworld"])
+
+    assert mapper.convert_chunks(world, java, jobs, lambda i, n: None) == []
+    assert set(java.chunks) == set(world.chunks) - {proto}
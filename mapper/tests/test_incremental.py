@@ -0,0 +1,93 @@
+import pytest
+
+import mapper
+from fakes import FakeBedrockWorld, anvil_format_class, make_world
+
+
+@pytest.fixture
+def converter(monkeypatch, make_glb_cfg):
+    """Run convert_bedrock_map_to_java_map on a fake world, one cycle per call."""
+    state = {"world": None, "cycle": 0}
+    anvil_format = anvil_format_class()
+    monkeypatch.setattr(mapper, "_load_amulet", lambda: None)
+    monkeypatch.setattr(mapper, "AnvilFormat", anvil_format)
+    monkeypatch.setattr(mapper, "LoaderNoneMatched", type("LoaderNoneMatched", (Exception,), {}))
+    monkeypatch.setattr(mapper, "amulet", type("amulet", (), {
+        "load_level": staticmethod(lambda path: state["world"])}))
+    monkeypatch.setattr(mapper, "prepare_bedrock_world_source",
+                        lambda path, workers: (path, None))
+    monkeypatch.setattr(mapper, "_last_conversion", None)
+
+    def run(world, **overrides):
+        glb_cfg = make_glb_cfg(**{"incremental_convert": True, **overrides})
+        db = glb_cfg.bedrock_world_dir / "db"
+        db.mkdir(parents=True, exist_ok=True)
+        # Change the world files so the whole-world signature never matches
+        state["cycle"] += 1
+        (db / "000001.log").write_text("x" * state["cycle"])
+        state["world"] = world
+        map_cfg = mapper.convert_bedrock_map_to_java_map(glb_cfg)
+        return map_cfg, anvil_format.worlds.get(str(glb_cfg.java_world_dir))
+
+    return run
+
+
+def test_incremental_conversion_tracks_changes_across_cycles(converter, caplog):
+    world = make_world(30)
+    map_cfg, java = converter(world)
+    assert map_cfg == mapper.MapConfig(name="Test World", min_y=-64, max_y=320)
+    assert java == world.chunks
+    assert "30 of 30 chunks changed, 0 removed" in caplog.text
+
+    keys = sorted(world.chunks)
+    chunks = dict(world.chunks)
+    chunks[keys[0]] = b"edited"
+    del chunks[keys[1]]
+    chunks[("overworld", 500, 500)] = b"added"
+    caplog.clear()
+    _, java = converter(FakeBedrockWorld(chunks))
+    assert java == chunks
+    assert "2 of 30 chunks changed, 1 removed" in caplog.text
+
+    caplog.clear()
+    _, java = converter(FakeBedrockWorld(chunks))
+    assert java == chunks
+    assert "0 of 30 chunks changed, 0 removed" in caplog.text
+
+
+def test_unreadable_chunk_keeps_its_java_copy(converter):
+    world = make_world(10)
+    converter(world)
+
+    again = FakeBedrockWorld(world.chunks)
+    unreadable = sorted(world.chunks)[3]
+    again.level_wrapper.unreadable.add(unreadable)
+    _, java = converter(again)
+
+    assert java == world.chunks
+
+
+def test_change_of_dimensions_rebuilds_the_java_world(converter, caplog):
+    world = FakeBedrockWorld({**make_world(10).chunks,
+                              **make_world(5, dimension="nether").chunks})
+    world.dimensions = ["overworld", "nether"]
+    _, java = converter(world)
+    assert sorted(java) == sorted(k for k in world.chunks if k[0] == "overworld")
+
+    caplog.clear()
+    _, java = converter(world, all_dimensions=True)
+    assert java == world.chunks
+    assert "Removing existing Java world" in caplog.text
+    mapper.wait_for_background_deletions()
+
+
+def test_without_the_flag_the_java_world_is_rebuilt(converter, make_glb_cfg):
+    world = make_world(10)
+    converter(world)
+    hashes = make_glb_cfg().java_world_dir / mapper._CHUNK_HASHES_NAME
+    assert hashes.exists()
+
+    _, java = converter(world, incremental_convert=False)
+    assert java == world.chunks
+    assert not hashes.exists()
+    mapper.wait_for_background_deletions()
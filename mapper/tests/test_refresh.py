@@ -0,0 +1,60 @@
+import types
+
+import pytest
+
+import mapper
+
+
+class RunningProcess:
+    def poll(self):
+        return None
+
+
+@pytest.fixture
+def service(monkeypatch):
+    """Drive run_periodic_refresh_service through a scripted list of world signatures."""
+    events = []
+
+    def run(signatures, failing_cycles=()):
+        signatures = iter(signatures)
+        cycles = iter(range(100))
+
+        def signature(_path):
+            try:
+                return next(signatures)
+            except StopIteration:
+                raise KeyboardInterrupt
+
+        def cycle(_cfg):
+            number = next(cycles)
+            events.append("cycle")
+            if number in failing_cycles:
+                raise RuntimeError("map config could not be written")
+
+        monkeypatch.setattr(mapper, "bedrock_world_signature", signature)
+        monkeypatch.setattr(mapper, "run_refresh_cycle", cycle)
+        monkeypatch.setattr(mapper, "render_map", lambda cfg: events.append("render"))
+        monkeypatch.setattr(mapper, "start_bluemap_webserver_process",
+                            lambda cfg: RunningProcess())
+        monkeypatch.setattr(mapper, "stop_bluemap_process", lambda process: None)
+        glb_cfg = types.SimpleNamespace(render_interval=0.001, trigger_port=0,
+                                        bedrock_world_dir=None)
+        mapper.run_periodic_refresh_service(glb_cfg)
+        return events
+
+    return run
+
+
+def test_unchanged_world_is_not_rendered_again(service):
+    assert service(["a", "a", "a", "b", "b"]) == [
+        "cycle", "render",  # initial
+        "cycle", "render",  # world changed to b
+    ]
+
+
+def test_failed_cycle_is_retried_even_if_the_world_is_unchanged(service):
+    assert service(["a", "b", "b", "b"], failing_cycles={1}) == [
+        "cycle", "render",
+        "cycle",            # failed before rendering b
+        "cycle", "render",  # retried
+    ]
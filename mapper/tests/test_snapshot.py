@@ -0,0 +1,91 @@
+import os
+
+import pytest
+
+import mapper
+
+
+def write(path, data):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+
+
+def tree(root):
+    """{relative path: bytes} for every file under root."""
+    return {
+        p.relative_to(root).as_posix(): p.read_bytes()
+        for p in sorted(root.rglob("*")) if p.is_file()
+    }
+
+
+@pytest.fixture
+def world(tmp_path):
+    src = tmp_path / "world"
+    write(src / "level.dat", b"level")
+    write(src / "levelname.txt", b"")
+    write(src / "db" / "CURRENT", b"MANIFEST-000001\n")
+    write(src / "db" / "000005.ldb", os.urandom(3 << 20))
+    write(src / "db" / "000007.log", b"log" * 1000)
+    (src / "resource_packs").mkdir()
+    return src
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_copies_the_whole_tree(tmp_path, world, workers):
+    dst = tmp_path / "snapshot"
+    mapper._fast_copy_tree(world, dst, workers)
+
+    assert tree(dst) == tree(world)
+    assert (dst / "resource_packs").is_dir()
+    assert os.stat(dst / "level.dat").st_mtime_ns == os.stat(world / "level.dat").st_mtime_ns
+
+
+def test_refresh_only_recopies_changed_files(tmp_path, world):
+    dst = tmp_path / "snapshot"
+    mapper._fast_copy_tree(world, dst, 2)
+    kept_inode = os.stat(dst / "db" / "000005.ldb").st_ino
+
+    write(world / "db" / "000007.log", b"longer log" * 1000)
+    (world / "levelname.txt").unlink()
+    write(world / "db" / "000009.ldb", b"new table")
+    mapper._fast_copy_tree(world, dst, 2)
+
+    assert tree(dst) == tree(world)
+    assert os.stat(dst / "db" / "000005.ldb").st_ino == kept_inode
+
+
+def test_refresh_replaces_entries_of_the_wrong_type(tmp_path, world):
+    dst = tmp_path / "snapshot"
+    mapper._fast_copy_tree(world, dst, 1)
+    (dst / "level.dat").unlink()
+    (dst / "level.dat").mkdir()
+    (dst / "resource_packs").rmdir()
+    (dst / "resource_packs").write_bytes(b"not a directory")
+
+    mapper._fast_copy_tree(world, dst, 1)
+
+    assert tree(dst) == tree(world)
+    assert (dst / "resource_packs").is_dir()
+
+
+def test_link_tables_hardlinks_only_ldb_files(tmp_path, world):
+    dst = tmp_path / "snapshot"
+    mapper._fast_copy_tree(world, dst, 2, link_tables=True)
+
+    assert os.path.samefile(dst / "db" / "000005.ldb", world / "db" / "000005.ldb")
+    assert not os.path.samefile(dst / "db" / "000007.log", world / "db" / "000007.log")
+    assert tree(dst) == tree(world)
+
+
+def test_refresh_never_writes_through_a_linked_table(tmp_path, world):
+    dst = tmp_path / "snapshot"
+    mapper._fast_copy_tree(world, dst, 1, link_tables=True)
+    source_table = (world / "db" / "000005.ldb").read_bytes()
+
+    # The snapshot's copy diverges (e.g. the converter's LevelDB rewrote it)
+    (dst / "db" / "000005.ldb").unlink()
+    write(dst / "db" / "000005.ldb", b"modified in the snapshot")
+    mapper._fast_copy_tree(world, dst, 1, link_tables=True)
+
+    assert (world / "db" / "000005.ldb").read_bytes() == source_table
+    assert os.path.samefile(dst / "db" / "000005.ldb", world / "db" / "000005.ldb")